@@ -143,6 +143,7 @@ if MODE == 'arp':
     SCALE_G = 55
     SCALE_A = 57
     SCALE_F = 65
+    INPUT_POLL_INTERVAL = 0.02  # seconds between key/menu scans
 
 
 
@@ -157,6 +158,7 @@ MAC_BROADCAST = b'\xFF\xFF\xFF\xFF\xFF\xFF'
 EXTRA_PAYLOAD = "PAYLOAD TO MAKE A PACKET MORE ROBUST..."    
 MIDI_CHANNEL = 1            # pick your MIDI channel here
 DEFAULT_INTENSITY = 100     # midi intensity for live input
+DEBUG = False               # print trace output from the main loops (slows them down)
 
 # Display settings
 # DISPLAY_WIDTH/HEIGHT: Physical display dimensions in pixels
@@ -242,6 +244,7 @@ UI_COLORS = {
 
 # Display settings
 DISPLAY_REFRESH_RATE = 250
+DISPLAY_FRAME_INTERVAL = 1 / 30  # min seconds between batched display refreshes
 
 
 # Text field positions
@@ -286,23 +289,25 @@ SAMPLE_MAP = {36: 0, 38: 1, 42: 2, 57: 3}
 
 #------10|-------20|-------30|-------40|-------50|-------60|-------70|-------80|
 # Network Settings
-NETWORK_PACKET_TYPES = {
-    'event': ord('e'),
-    'live': ord('l'),
-    'pair': ord('p'),
-    'tick': ord('t'),
-    'begin': ord('b'),
-    'stop': ord('s'),
-    'header': ord('h'),
-    'mute': ord('m'),
-    'update': ord('u'),
-    'reset': ord('r'),
-    'clear': ord('c'),
-    'scale': ord('n')  # Added scale packet type
-}
+# Packet type tags: the first byte of each packet on the air, also used as the
+# first item of the tuples returned by PacketHandler.handle_packet
+PKT_EVENT = ord('e')
+PKT_LIVE = ord('l')
+PKT_PAIR = ord('p')
+PKT_TICK = ord('t')
+PKT_BEGIN = ord('b')
+PKT_STOP = ord('s')
+PKT_HEADER = ord('h')
+PKT_MUTE = ord('m')
+PKT_UPDATE = ord('u')
+PKT_RESET = ord('r')
+PKT_CLEAR = ord('c')
+PKT_SCALE = ord('n')
 
 NETWORK_PACKET_RETRANSMISSION = 1
 NETWORK_PACKET_DELAY = 0.004
+NETWORK_IDLE_SLEEP = 0.001  # yield to background tasks when paused and no packet arrived
+NETWORK_MAX_PACKETS_PER_LOOP = 8  # packets handled per main loop pass before other work runs
 
 #------10|-------20|-------30|-------40|-------50|-------60|-------70|-------80|
 # Song Settings
@@ -0,0 +1,28 @@
+"""
+Error reporting for the core module.
+
+This module provides a common way to report errors on the console and display.
+"""
+
+def report_error(display_manager, error_msg, is_fatal=False):
+    """
+    Report an error to the display and console.
+    
+    The debug text field only shows its first characters, so the message is
+    passed on whole and truncated by the display instead of sliced here.
+    
+    Args:
+        display_manager: DisplayManager instance
+        error_msg: Error message to display
+        is_fatal: Whether this is a fatal error
+    """
+    # Always print to serial console
+    print(f"{'FATAL ERROR' if is_fatal else 'Error'}: {error_msg}")
+    
+    # Print to display if available
+    if display_manager:
+        try:
+            prefix = "FATAL: " if is_fatal else "Error: "
+            display_manager.show_debug_message(prefix + error_msg)
+        except Exception as e:
+            print(f"Error displaying error message: {e}")
@@ -83,6 +83,53 @@ def key_new(pos):
         prev[pos] = 0
     return False
 
+# new keys pressed since last scan? returns a bitmask (bit n = key n)
+# reads the whole matrix once instead of one key_new() call per key
+def scan_keys():
+    new = 0
+    for r in range(2):
+        if r == 0:
+            row1.direction = digitalio.Direction.OUTPUT
+            row0.direction = digitalio.Direction.INPUT
+        else:
+            row0.direction = digitalio.Direction.OUTPUT
+            row1.direction = digitalio.Direction.INPUT
+        offset = r * config.KEY_COL
+        for i in range(config.KEY_COL):
+            pos = offset + i
+            if not col[i].value:
+                if prev[pos] == 0:
+                    new |= 1 << pos
+                prev[pos] = 1
+            else:
+                prev[pos] = 0
+    return new
+
+# keys changed since last scan? returns (changed, state) bitmasks (bit n = key n)
+# reads keys 0..count-1 in one pass instead of one key_change() call per key
+def scan_key_changes(count=2 * config.KEY_COL):
+    changed = 0
+    state = 0
+    for r in range(2):
+        offset = r * config.KEY_COL
+        if offset >= count:
+            break
+        if r == 0:
+            row1.direction = digitalio.Direction.OUTPUT
+            row0.direction = digitalio.Direction.INPUT
+        else:
+            row0.direction = digitalio.Direction.OUTPUT
+            row1.direction = digitalio.Direction.INPUT
+        for i in range(min(config.KEY_COL, count - offset)):
+            pos = offset + i
+            down = not col[i].value
+            if down:
+                state |= 1 << pos
+            if down != prev[pos]:
+                changed |= 1 << pos
+            prev[pos] = down
+    return changed, state
+
 # new key changed since last? 
 def key_change(pos):
     if pos < config.KEY_COL:
@@ -243,6 +290,20 @@ def check_analog_rotation(dir):
             wheel2_old = sample
     return False
 
+# menu wheel rotation as -1, 0 or 1
+def menu_rotation_analog():
+    if check_analog_rotation(config.ROTATION_CW):
+        return 1
+    if check_analog_rotation(config.ROTATION_CCW):
+        return -1
+    return 0
+
+def menu_rotation_encoder():
+    return check_rotation(0, 512)
+
+# the hw version is fixed, so pick the variant once instead of on every call
+menu_rotation = menu_rotation_encoder if config.HW_VERSION == 1.1 else menu_rotation_analog
+
 num_pixels = config.NEOPIXEL_NUM
 pixels = neopixel.NeoPixel(config.NEOPIXEL_PIN, num_pixels, brightness=0.2)
 
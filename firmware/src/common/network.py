@@ -199,87 +199,111 @@ class PacketHandler:
             packet: The received packet
             
         Returns:
-            tuple: Packet type and arguments, or None if packet is invalid
+            tuple: Packet type (config.PKT_*) and arguments, or None if packet is invalid
         """
         if not packet:
             return None
 
-        packet_types = config.NETWORK_PACKET_TYPES
         msg = packet.msg
+        tag = msg[0]
+
+        # fields are decoded straight from msg: espnow has no read-into-buffer
+        # call, so the received packet is the only allocation per read and
+        # slicing for int.from_bytes would add one more per field
 
         # check if the packet is an "event" packet
-        if msg[0] == packet_types['event']:
-            tick_start = int.from_bytes(msg[1:3], "big")
-            tick_end = int.from_bytes(msg[3:5], "big")
+        if tag == config.PKT_EVENT:
+            tick_start = (msg[1] << 8) | msg[2]
+            tick_end = (msg[3] << 8) | msg[4]
             ch = msg[5]
             note = msg[6]
             intensity = msg[7]
-            return ('event', ch, tick_start, tick_end, note, intensity)
+            return (config.PKT_EVENT, ch, tick_start, tick_end, note, intensity)
 
         # check if the packet is a "live" packet
-        elif msg[0] == packet_types['live']:
+        elif tag == config.PKT_LIVE:
             ch = msg[1]
             note = msg[2]
             intensity = msg[3]
-            return ('live', ch, note, intensity)
+            return (config.PKT_LIVE, ch, note, intensity)
 
         # check if the packet is a "pair_request" packet
-        elif msg[0] == packet_types['pair']:
+        elif tag == config.PKT_PAIR:
             id = msg[1]
-            return ('pair', id)
+            return (config.PKT_PAIR, id)
 
         # check if the packet is a "tick" packet
-        elif msg[0] == packet_types['tick']:
-            tick = int.from_bytes(msg[1:3], "big")
-            return ('tick', tick)
+        elif tag == config.PKT_TICK:
+            tick = (msg[1] << 8) | msg[2]
+            return (config.PKT_TICK, tick)
 
         # check if the packet is a "begin" packet
-        elif msg[0] == packet_types['begin']:
-            return ('begin',)
+        elif tag == config.PKT_BEGIN:
+            return (config.PKT_BEGIN,)
 
         # check if the packet is a "stop" packet
-        elif msg[0] == packet_types['stop']:
-            return ('stop',)
+        elif tag == config.PKT_STOP:
+            return (config.PKT_STOP,)
 
         # check if the packet is a "header" packet
-        elif msg[0] == packet_types['header']:
-            ticks_per_beat = int.from_bytes(msg[1:3], "big")
-            max_ticks = int.from_bytes(msg[3:7], "big")
-            tempo = int.from_bytes(msg[7:9], "big")
+        elif tag == config.PKT_HEADER:
+            ticks_per_beat = (msg[1] << 8) | msg[2]
+            max_ticks = (msg[3] << 24) | (msg[4] << 16) | (msg[5] << 8) | msg[6]
+            tempo = (msg[7] << 8) | msg[8]
             numerator = msg[9]
             denominator = msg[10]
             nr_instruments = msg[11]
-            return ('header', ticks_per_beat, max_ticks, tempo, numerator, denominator, nr_instruments)
+            return (config.PKT_HEADER, ticks_per_beat, max_ticks, tempo, numerator, denominator, nr_instruments)
 
         # check if the packet is a "mute" packet
-        elif msg[0] == packet_types['mute']:
+        elif tag == config.PKT_MUTE:
             ch = msg[1]
             intensity = msg[2]
-            return ('mute', ch, intensity)
+            return (config.PKT_MUTE, ch, intensity)
 
         # check if the packet is an "update" packet
-        elif msg[0] == packet_types['update']:
-            return ('update',)
+        elif tag == config.PKT_UPDATE:
+            return (config.PKT_UPDATE,)
 
         # check if the packet is a "reset" packet
-        elif msg[0] == packet_types['reset']:
-            return ('reset',)
+        elif tag == config.PKT_RESET:
+            return (config.PKT_RESET,)
 
         # check if the packet is a "clear" packet
-        elif msg[0] == packet_types['clear']:
+        elif tag == config.PKT_CLEAR:
             id = msg[1]
-            return ('clear', id)
+            return (config.PKT_CLEAR, id)
 
         # check if the packet is a "scale" packet
-        elif msg[0] == packet_types['scale']:
+        elif tag == config.PKT_SCALE:
             if len(msg) >= 10:  # Ensure we have enough bytes
                 scale_start = msg[2]
                 scale = list(msg[3:10])  # Get 7 scale intervals
-                return ('scale', scale_start, scale)
+                return (config.PKT_SCALE, scale_start, scale)
             return None
 
         return None
 
+    def live_frames(self, packet):
+        """
+        Iterate over all "live" frames in a packet.
+        
+        Senders may pack several 'l' frames back-to-back in one packet
+        to save airtime, e.g. when multiple keys change in the same scan.
+        
+        Args:
+            packet: The received packet
+            
+        Yields:
+            tuple: (ch, note, intensity) for each frame
+        """
+        msg = packet.msg
+        live = config.PKT_LIVE
+        for i in range(0, len(msg) - 3, 4):
+            if msg[i] != live:
+                break
+            yield (msg[i + 1], msg[i + 2], msg[i + 3])
+
     def check_packets(self):
         """
         Check for and handle incoming packets.
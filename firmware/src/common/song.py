@@ -174,6 +174,8 @@ class SongPlayer:
         song_index: Current position in song
         start_time: Time when playback started
         sprite_last_pos: Last sprite position
+        last_channel_info: Last (channel, note, intensity) shown on the display
+        song_bytes: Raw song file contents, read on first use
     """
     
     def __init__(self, song: Song, audio_system: Play, network_manager: PacketHandler):
@@ -192,6 +194,20 @@ class SongPlayer:
         self.song_index = 0
         self.start_time = 0
         self.sprite_last_pos = 0
+        self.last_channel_info = (0, 0, 0)
+        self.song_bytes = None
+    
+    def get_song_bytes(self) -> bytes:
+        """
+        Get the raw song file contents, reading the file only once.
+        
+        Returns:
+            bytes: Song file contents
+        """
+        if self.song_bytes is None:
+            with open(self.song.file_path + self.song.file_name + ".bin", 'rb') as f:
+                self.song_bytes = f.read()
+        return self.song_bytes
     
     def play(self):
         """Start or resume playback."""
@@ -211,6 +227,7 @@ class SongPlayer:
         """Reset to beginning."""
         self.song_index = 0
         self.sprite_last_pos = 0
+        self.last_channel_info = (0, 0, 0)
         self.start_time = time.monotonic()
         self.network_manager.send_packet('r', self.network_manager.PAYLOAD, retransmission=2)
     
@@ -272,19 +289,23 @@ class LocalSong:
         instrument_id: ID of the instrument this song is for
         events: List of song events for this instrument
         metadata: Dictionary of song metadata
-        pattern_roll: List of lists for pattern display
+        pattern_roll: One int per pixel for pattern display, bit n set when
+            the note in roll row n is played at that pixel
+        roll_rows: Dictionary mapping note number to pattern_roll row
     """
     
-    def __init__(self, instrument_id: int):
+    def __init__(self, instrument_id: int, roll_notes: tuple = ()):
         """
         Initialize a new local song.
         
         Args:
             instrument_id: ID of the instrument this song is for
+            roll_notes: Notes shown in the pattern roll, one per row
         """
         self.instrument_id = instrument_id
         self.events = []
         self.pattern_roll = []
+        self.roll_rows = {note: row for row, note in enumerate(roll_notes)}
         self.metadata = config.DEFAULT_SONG_METADATA.copy()
         self.metadata.update({
             'pixels_per_beat': 4,
@@ -312,9 +333,9 @@ class LocalSong:
         self.metadata['ticks_per_pixel'] = self.metadata['ticks_per_beat'] / self.metadata['pixels_per_beat']
         self.metadata['max_pixels'] = int(self.metadata['max_ticks'] / self.metadata['ticks_per_pixel'])
         
-        # Initialize pattern roll if needed
-        if self.metadata['max_pixels'] > 0 and len(self.pattern_roll) != self.metadata['max_pixels']:
-            self.pattern_roll = [[] for _ in range(self.metadata['max_pixels'])]
+        # Initialize pattern roll if needed (only modes that show one pass roll_notes)
+        if self.roll_rows and self.metadata['max_pixels'] > 0 and len(self.pattern_roll) != self.metadata['max_pixels']:
+            self.pattern_roll = [0] * self.metadata['max_pixels']
     
     def update_header(self, ticks_per_beat: int, max_ticks: int, tempo: int, 
                      numerator: int, denominator: int, nr_instruments: int):
@@ -360,10 +381,10 @@ class LocalSong:
             self._update_metadata()
             
         # Add to pattern roll
+        row = self.roll_rows.get(note)
         pixel_start = int(tick_start / self.metadata['ticks_per_pixel'])
-        if pixel_start < len(self.pattern_roll):
-            if note not in self.pattern_roll[pixel_start]:
-                self.pattern_roll[pixel_start].append(note)
+        if row is not None and pixel_start < len(self.pattern_roll):
+            self.pattern_roll[pixel_start] |= 1 << row
     
     def clear(self):
         """Clear all events and reset metadata."""
@@ -415,9 +436,9 @@ class LocalSong:
             pixel_pos: Position in pattern roll
             note: Note to remove
         """
-        if 0 <= pixel_pos < len(self.pattern_roll):
-            if note in self.pattern_roll[pixel_pos]:
-                self.pattern_roll[pixel_pos].remove(note)
+        row = self.roll_rows.get(note)
+        if row is not None and 0 <= pixel_pos < len(self.pattern_roll):
+            self.pattern_roll[pixel_pos] &= ~(1 << row)
 
 def add_event_last(array: list, packet: list) -> None:
     """
@@ -4,6 +4,7 @@ UI components for the core module.
 This module provides common UI components used across the application.
 """
 
+import time
 import displayio
 import adafruit_imageload
 from src.common import hw
@@ -34,6 +35,9 @@ class DisplayManager:
         self.sprites = {}
         self.text_fields = {}
         self.colors = config.UI_COLORS
+        self.batch_depth = 0            # nesting level of batched() blocks
+        self.refresh_pending = False    # a refresh was requested inside a batch
+        self.last_refresh = 0           # time of the last refresh
         
         # Create black background
         self.black_sprite = displayio.TileGrid(
@@ -53,6 +57,64 @@ class DisplayManager:
         self.x_max = None
         self.y_max = None
     
+    def refresh(self):
+        """Refresh the display now, or when the outermost batched() block exits."""
+        if self.batch_depth:
+            self.refresh_pending = True
+        else:
+            # an immediate refresh also shows any pending changes
+            self.refresh_pending = False
+            self.last_refresh = time.monotonic()
+            self.display.refresh()
+
+    def flush(self, full: bool = False):
+        """
+        Push display changes to the screen (deferred inside a batched() block).
+        
+        displayio tracks which areas changed and only sends those, so callers
+        should avoid touching sprites that did not change.
+        
+        Args:
+            full: Redraw the whole screen, e.g. to clear glitches after a reset
+        """
+        if full:
+            # Un-hiding the full-screen background marks the whole screen as changed
+            self.black_sprite.hidden = True
+            self.black_sprite.hidden = False
+        self.refresh()
+
+    def batched(self):
+        """
+        Group display updates into a single refresh.
+        
+        Blocks can be nested; the refresh happens when the outermost block exits,
+        at most once per DISPLAY_FRAME_INTERVAL. A refresh that is too early
+        stays pending until a later block exits.
+        
+        Usage:
+            with display_manager.batched():
+                display_manager.update_channel_info(ch, note, intensity)
+                display_manager.update_playback_position(pos)
+        
+        Returns:
+            DisplayManager: self, used as a context manager
+        """
+        return self
+
+    def __enter__(self):
+        self.batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.batch_depth -= 1
+        if self.batch_depth == 0 and self.refresh_pending:
+            now = time.monotonic()
+            if now - self.last_refresh >= config.DISPLAY_FRAME_INTERVAL:
+                self.last_refresh = now
+                self.refresh_pending = False
+                self.display.refresh()
+        return False
+    
     def initialize_pattern_field(self, sprite_sheet, palette, x_start=0, y_start=0):
         """
         Initialize the pattern field display.
@@ -69,7 +131,7 @@ class DisplayManager:
                           self.x_max, self.y_max, 
                           tile_width=config.FIELD_TILE_WIDTH, 
                           tile_height=config.FIELD_TILE_HEIGHT)
-        self.display.refresh()
+        self.refresh()
     
     def load_song_background(self, song_name: str):
         """
@@ -78,10 +140,10 @@ class DisplayManager:
         Args:
             song_name: Name of the song
         """
-        bg = Image(self.display_group, f"assets/images/{song_name}.bmp")
+        bg = Image(self.display_group, f"assets/images/{song_name}.bmp", refresh=self.refresh)
         bg.tile.y = 35
         self.sprites['background'] = bg
-        self.display.refresh()
+        self.refresh()
     
     def create_position_sprite(self):
         """Create the position sprite for song playback visualization."""
@@ -94,7 +156,7 @@ class DisplayManager:
         pos_sprite.setSprite(3)
         pos_sprite.setPos(0, 26)
         self.sprites['position'] = pos_sprite
-        self.display.refresh()
+        self.refresh()
     
     def create_text_fields(self, title):
         """Create and initialize text fields for display."""
@@ -105,7 +167,7 @@ class DisplayManager:
         self.text_fields['intensity'] = self.hw.SpriteText(positions['intensity'][0], positions['intensity'][1], "000")
         self.text_fields['menu'] = self.hw.SpriteText(positions['menu'][0], positions['menu'][1], "Menu            ")
         self.text_fields['debug'] = self.hw.SpriteText(positions['debug'][0], positions['debug'][1], "                ")
-        self.display.refresh()
+        self.refresh()
     
     def update_playback_position(self, position: int):
         """
@@ -114,9 +176,10 @@ class DisplayManager:
         Args:
             position: New position
         """
-        if 'position' in self.sprites:
-            self.sprites['position'].setPos(position, 26)
-        self.display.refresh()
+        sprite = self.sprites.get('position')
+        if sprite and sprite.s.x != position:
+            sprite.setPos(position, 26)
+            self.refresh()
     
     def update_channel_info(self, channel: int, note: int, intensity: int):
         """
@@ -133,7 +196,7 @@ class DisplayManager:
             self.text_fields['note'].showValue(note)
         if 'intensity' in self.text_fields:
             self.text_fields['intensity'].showValue(intensity)
-        self.display.refresh()
+        self.refresh()
     
     def update_menu_text(self, text: str):
         """
@@ -144,7 +207,7 @@ class DisplayManager:
         """
         if 'menu' in self.text_fields:
             self.text_fields['menu'].showText(text)
-        self.display.refresh()
+        self.refresh()
     
     def show_debug_message(self, message: str):
         """
@@ -155,14 +218,14 @@ class DisplayManager:
         """
         if 'debug' in self.text_fields:
             self.text_fields['debug'].showText(message)
-        self.display.refresh()
+        self.refresh()
     
-    def update_mute_leds(self, mute_states: list):
+    def update_mute_leds(self, mute_states):
         """
         Update the mute LED states.
         
         Args:
-            mute_states: List of mute states
+            mute_states: Sequence of mute states (only read, never modified)
         """
 
         for i, is_muted in enumerate(mute_states):
@@ -179,9 +242,7 @@ class DisplayManager:
     
     def redraw(self):
         """Redraw the display to clear any glitches."""
-        self.display_group.append(self.black_sprite)
-        self.display_group.pop()
-        self.display.refresh()
+        self.flush(full=True)
 
 class Sprite:
     """
@@ -327,9 +388,12 @@ class Image:
     
     Attributes:
         display_group: Display group containing the image
+        cache: Dictionary of preloaded tiles by image path
+        refresh: Callable used to push changes to the screen
     """
     
-    def __init__(self, display_group: displayio.Group, image_path: str, width: int = 160, height: int = 128):
+    def __init__(self, display_group: displayio.Group, image_path: str, width: int = 160, height: int = 128,
+                 refresh=None, preload_paths: list = ()):
         """
         Initialize a new image.
         
@@ -338,12 +402,31 @@ class Image:
             image_path: Path to the image file
             width: Width of the image in pixels
             height: Height of the image in pixels
+            refresh: Refresh callable, pass DisplayManager.refresh so changes
+                join its batched() blocks (defaults to an immediate refresh)
+            preload_paths: Images to keep decoded (see preload()), loaded
+                before image_path so it is decoded only once if listed
         """
         self.display_group = display_group
         self.width = width
         self.height = height
+        self.cache = {}
+        self.refresh = refresh or hw.display.refresh
+        self.preload(preload_paths)
         self.load(image_path)
 
+    def preload(self, image_paths: list) -> None:
+        """
+        Decode images once and keep them in RAM, so replace() can swap them
+        in without reading and decoding the file again.
+        
+        Args:
+            image_paths: Paths to the image files
+        """
+        for image_path in image_paths:
+            if image_path not in self.cache:
+                self.cache[image_path] = self._load_tile(image_path)
+
     def replace(self, image_path: str) -> None:
         """
         Replace the current image with a new one.
@@ -356,23 +439,37 @@ class Image:
 
     def load(self, image_path: str) -> None:
         """
-        Load an image from a file.
+        Load an image from a file (or from the cache if preloaded).
+        
+        Args:
+            image_path: Path to the image file
+        """
+        load_tile = self.cache.get(image_path)
+        if load_tile is None:
+            load_tile = self._load_tile(image_path)
+        self.display_group.append(load_tile)
+        self.tile = load_tile
+        self.refresh()
+
+    def _load_tile(self, image_path: str) -> displayio.TileGrid:
+        """
+        Decode an image file into a tile.
         
         Args:
             image_path: Path to the image file
+            
+        Returns:
+            displayio.TileGrid: A single tile covering the entire bitmap
         """
         load_bitmap, load_palette = adafruit_imageload.load(image_path, 
                                                           bitmap=displayio.Bitmap, 
                                                           palette=displayio.Palette)
         # Create a single tile that covers the entire bitmap
-        load_tile = displayio.TileGrid(load_bitmap, 
-                                     pixel_shader=load_palette, 
-                                     width=1, height=1, 
-                                     tile_width=load_bitmap.width, 
-                                     tile_height=load_bitmap.height)
-        self.display_group.append(load_tile)
-        self.tile = load_tile
-        hw.display.refresh()
+        return displayio.TileGrid(load_bitmap, 
+                                  pixel_shader=load_palette, 
+                                  width=1, height=1, 
+                                  tile_width=load_bitmap.width, 
+                                  tile_height=load_bitmap.height)
 
     def clear(self, color: int) -> None:
         """
@@ -389,7 +486,7 @@ class Image:
                                        pixel_shader=load_palette, 
                                        x=0, y=0)
         self.display_group.append(load_sprite)
-        hw.display.refresh()
+        self.refresh()
 
 def colorwheel(pos: int) -> tuple:
     """
@@ -30,6 +30,7 @@ import adafruit_imageload                                         # type: ignore
 from src.common.ui import DisplayManager, colorwheel
 from src.common.network import PacketHandler, NetworkError, PacketSendError, PacketReadError, SongSendError
 from src.common.menu import MenuManager
+from src.common.errors import report_error
 
 
 class Field:
@@ -112,10 +113,12 @@ class ArpeggiatorState:
         self.start_time = time.monotonic()
         self.old_note = 0
         self.arp_pos = 0
-        self.arp_notes = []
-        self.chord_notes = []
-        self.scale_notes = []
-        self.arp2d = [[],[],[],[]]
+        # Preallocated so scale changes overwrite in place instead of allocating
+        self.arp_notes = [0] * len(config.DEFAULT_ARP_PATTERN)
+        self.chord_notes = [0] * 3
+        self.scale_notes = [0] * 7
+        self.note_color = {}  # note -> octave colour, filled on scale change
+        self.arp2d = [0, 0, 0, 0]  # one key bitmask per arp step
         self.pos = 0
         
         # Calculate time conversion factors
@@ -124,29 +127,35 @@ class ArpeggiatorState:
 
     def update_scale(self, scale_start, scale):
         """Update scale and chord notes based on new scale"""
-        self.scale_notes = [s + scale_start for s in scale]
+        for i, s in enumerate(scale):
+            self.scale_notes[i] = s + scale_start
         
         # Update chord notes
-        self.chord_notes = []
-        for a in range(0,5,2):
-            note = scale[a] + scale_start
+        for i in range(3):
+            note = scale[i * 2] + scale_start
             while note > config.MAX_NOTE:
                 note -= 12
             while note < config.MIN_NOTE:
                 note += 12
-            self.chord_notes.append(note)
+            self.chord_notes[i] = note
         self.chord_notes.sort()
 
         # Update arpeggiator notes
-        arp = config.DEFAULT_ARP_PATTERN
-        self.arp_notes = [self.chord_notes[a] for a in arp]
+        for i, a in enumerate(config.DEFAULT_ARP_PATTERN):
+            self.arp_notes[i] = self.chord_notes[a]
+
+        # Cache LED colours for the notes the arpeggio will play
+        for note in self.arp_notes:
+            if note not in self.note_color:
+                self.note_color[note] = colorwheel(note // 12 * 20 & 255)
 
     def reset(self):
         """Reset state to initial values"""
         self.start_time = time.monotonic()
         self.arp_pos = len(self.arp_notes) - 1 if self.arp_notes else 0
         self.pos = 0
-        self.arp2d = [[],[],[],[]]
+        for i in range(len(self.arp2d)):
+            self.arp2d[i] = 0
 
     def initialize_scale(self, scale_start=60):
         """Initialize scale with default values"""
@@ -193,8 +202,7 @@ class ArpeggiatorUI:
         """Update the pattern display"""
         field.reset(0)
         for y in range(4):
-            for x in arp2d[y]:
-                field.setBlock(x, y, config.PATTERN_ACTIVE_TILE)
+            setRow(field, arp2d[y], y, config.PATTERN_ACTIVE_TILE)
         field.setBlock(pos % config.FIELD_X_MAX, int(pos / config.FIELD_X_MAX), config.PATTERN_CURRENT_TILE)
         self.hw.display.refresh()
 
@@ -255,26 +263,25 @@ class ArpeggiatorNetwork:
 
     def handle_packet(self, packet):
         """Process incoming network packet"""
-        try:
-            return self.packet_handler.handle_packet(packet)
-        except PacketReadError as e:
-            raise
-        except Exception as e:
-            raise
+        return self.packet_handler.handle_packet(packet)
 
     def send_packet(self, packet_type, args):
         """Send a packet over the network"""
-        try:
-            self.packet_handler.send_packet(packet_type, args)
-        except PacketSendError as e:
-            raise
-        except Exception as e:
-            raise
+        self.packet_handler.send_packet(packet_type, args)
 
     def send_note(self, note, intensity):
         """Send a note packet"""
         self.send_packet('l', [self.instrument_id, note, intensity])
 
+    def send_notes(self, notes):
+        """Send several (note, intensity) pairs as back-to-back 'l' frames in one packet"""
+        payload = bytearray()
+        for note, intensity in notes:
+            if payload:
+                payload.append(ord('l'))
+            payload.extend((self.instrument_id, note, intensity))
+        self.send_packet('l', payload)
+
 class ArpeggiatorInput:
     """Handles all input-related operations for the arpeggiator"""
     def __init__(self, hw, state, ui, network):
@@ -284,30 +291,32 @@ class ArpeggiatorInput:
         self.network = network
 
     def handle_key_input(self):
-        """Process key input events"""
+        """Process key input events (all changes in one scan give one redraw and one packet)"""
+        events = []
+        pattern_changed = False
+        # notes are only sent when not muted, and only keys with an arp note have one
+        send = not self.state.mute
+        arp_notes = self.state.arp_notes
+        note_keys = len(arp_notes)
         for i in range(12):
             val, new = self.hw.key_change(i)
             if new and val:
                 self.state.arp2d, self.state.pos, old_pos, remove, add = newKey(self.state.arp2d, i, self.state.pos)
-                self.ui.update_pattern(self.ui.field, self.state.arp2d, self.state.pos)
-                if not self.state.mute:
-                    self.network.send_note(self.state.arp_notes[i], config.DEFAULT_INTENSITY)
-                
+                pattern_changed = True
+                if send and i < note_keys:
+                    events.append((arp_notes[i], config.DEFAULT_INTENSITY))
             elif new and not val:
-                if not self.state.mute:
-                    self.network.send_note(self.state.arp_notes[i], 0)
+                if send and i < note_keys:
+                    events.append((arp_notes[i], 0))
+
+        if pattern_changed:
+            self.ui.update_pattern(self.ui.field, self.state.arp2d, self.state.pos)
+        if events:
+            self.network.send_notes(events)
 
     def handle_menu_input(self, menu_manager):
         """Process menu navigation input"""
-        rotation = 0  # Initialize rotation to 0
-        if config.HW_VERSION == 1.1:
-            rotation = self.hw.check_rotation(0, 512)
-        elif config.HW_VERSION == 1.0:
-            if self.hw.check_analog_rotation(config.ROTATION_CW):
-                rotation = 1
-            elif self.hw.check_analog_rotation(config.ROTATION_CCW):
-                rotation = -1
-
+        rotation = self.hw.menu_rotation()
         if rotation:
             menu_manager.handle_rotation(rotation)
         if self.hw.key_new(config.KEY_BACK):
@@ -365,14 +374,15 @@ class ArpeggiatorPlayback:
         packet.append(intensity)
         i = note % 12
         if not self.state.mute:
-            self.hw.pixels[i] = colorwheel(int(note / 12) * 20  & 255)
+            color = self.state.note_color.get(note)
+            if color is None:
+                color = self.state.note_color[note] = colorwheel(note // 12 * 20 & 255)
+            self.hw.pixels[i] = color
             self.network.esp.send(packet, self.network.peer_broadcast)
         
         # Update pattern display
-        for n in self.state.arp2d[self.state.arp_pos]:
-            self.ui.field.setBlock(n, self.state.arp_pos, 2)
-        for n in self.state.arp2d[arp_pos_new]:
-            self.ui.field.setBlock(n, arp_pos_new, 1)
+        setRow(self.ui.field, self.state.arp2d[self.state.arp_pos], self.state.arp_pos, 2)
+        setRow(self.ui.field, self.state.arp2d[arp_pos_new], arp_pos_new, 1)
             
         # Update state
         self.state.arp_pos = arp_pos_new
@@ -418,37 +428,44 @@ class Arpeggiator:
 
     def run(self):
         """Main loop"""
+        next_input_time = 0
+        stage = "Main loop"
         while True:
+            # A single handler outside the inner loop: no exception frame is set up per tick.
+            # On error, report it with the stage it came from and resume the loop.
+            # Packets get their own handler so a bad packet never blocks key input.
             try:
-                # Update playback
-                self.playback.update()
-
-                # Handle network packets
-                if self.network.esp:
-                    try:
-                        packet = self.network.packet_handler.read_packet()
-                        if packet:
-                            result = self.network.handle_packet(packet)
-                            if result:
-                                self._handle_packet_result(result)
-                                    
-                    except PacketReadError as e:
-                        report_error(self.display_manager, f"Packet read error: {e}")
-                    except Exception as e:
-                        report_error(self.display_manager, f"Network error: {e}")
-
-                # Handle input
-                try:
-                    self.input_handler.handle_key_input()
-                    self.input_handler.handle_menu_input(self.menu_manager)
-                except Exception as e:
-                    report_error(self.display_manager, f"Input error: {e}")
+                while True:
+                    # Update playback
+                    stage = "Main loop"
+                    self.playback.update()
+
+                    # Handle network packets
+                    if self.network.esp:
+                        try:
+                            packet = self.network.packet_handler.read_packet()
+                            if packet:
+                                result = self.network.handle_packet(packet)
+                                if result:
+                                    self._handle_packet_result(result)
+                        except PacketReadError as e:
+                            report_error(self.display_manager, f"Packet read error: {e}")
+                        except Exception as e:
+                            report_error(self.display_manager, f"Network error: {e}")
+
+                    # Handle input (human input does not need faster polling than this)
+                    now = time.monotonic()
+                    if now >= next_input_time:
+                        next_input_time = now + config.INPUT_POLL_INTERVAL
+                        stage = "Input"
+                        self.input_handler.handle_key_input()
+                        self.input_handler.handle_menu_input(self.menu_manager)
 
             except KeyboardInterrupt:
                 report_error(self.display_manager, "User interrupted")
                 break
             except Exception as e:
-                report_error(self.display_manager, f"Main loop error: {e}")
+                report_error(self.display_manager, f"{stage} error: {e}")
                 # Continue running despite errors
 
     def _handle_packet_result(self, result):
@@ -457,26 +474,26 @@ class Arpeggiator:
             packet_type, *args = result
             
             # Handle tick packet
-            if packet_type == 'tick':
+            if packet_type == config.PKT_TICK:
                 tick = args[0]
                 now_tick = int(self.state.time_to_tick * (time.monotonic() - self.state.start_time))
                 tick_delta = tick - now_tick
                 
             # Handle begin packet
-            elif packet_type == 'begin':
+            elif packet_type == config.PKT_BEGIN:
                 self.state.start_time = time.monotonic()
                 self.state.mode = config.PLAYBACK_STATES["playing"]
                 self.display_manager.show_debug_message("playing")
                 
             # Handle stop packet
-            elif packet_type == 'stop':
+            elif packet_type == config.PKT_STOP:
                 self.state.mode = config.PLAYBACK_STATES["paused"]
                 self.display_manager.show_debug_message("paused")
                 if self.state.old_note != 0:
                     self.network.send_note(self.state.old_note, 0)
                     
             # Handle header packet
-            elif packet_type == 'header':
+            elif packet_type == config.PKT_HEADER:
                 self.state.ticks_per_beat, self.state.max_ticks, self.state.tempo, numerator, self.state.denominator, nr_instruments = args
                 self.state.tick_to_time = 60 * 4 / (self.state.tempo * self.state.ticks_per_beat * self.state.denominator)
                 self.state.time_to_tick = (self.state.tempo * self.state.ticks_per_beat * self.state.denominator) / (60 * 4)
@@ -484,7 +501,7 @@ class Arpeggiator:
                 self.state.mode = config.PLAYBACK_STATES["paused"]
                 
             # Handle mute packet
-            elif packet_type == 'mute':
+            elif packet_type == config.PKT_MUTE:
                 ch, intensity = args
                 if ch == self.instrument_id:
                     self.state.mute = intensity
@@ -498,14 +515,17 @@ class Arpeggiator:
                         self.display_manager.show_debug_message(" ")
                         
             # Handle update packet
-            elif packet_type == 'update':
+            elif packet_type == config.PKT_UPDATE:
                 self.display_manager.show_debug_message("update")
                 self.display_manager.show_debug_message(" ")
-                redraw()
+                # Create and remove a black sprite to refresh the screen
+                self.hw.displayGroup.append(displayio.TileGrid(displayio.Bitmap(160, 128, 1), pixel_shader=displayio.Palette(1), x=0, y=0))
+                self.hw.displayGroup.pop()
+                self.hw.display.refresh()
                 self.display_manager.update_channel_info(0, 0, 0)
                 
             # Handle reset packet
-            elif packet_type == 'reset':
+            elif packet_type == config.PKT_RESET:
                 self.state.reset()
                 self.display_manager.show_debug_message("reset")
                 self.ui.background.replace("arp0.bmp")
@@ -515,17 +535,17 @@ class Arpeggiator:
                 self.ui.update_pattern(self.ui.field, self.state.arp2d, 0)
                 
             # Handle clear packet
-            elif packet_type == 'clear':
+            elif packet_type == config.PKT_CLEAR:
                 id = args[0]
                 if id == self.instrument_id or id == 255:
                     self.display_manager.show_debug_message("receiving")
-                    self.state.arp_notes = [55, 60, 64, 60]
+                    self.state.arp_notes[:] = (55, 60, 64, 60)
                     if not self.state.mute:
                         self.ui.update_leds(self.state.arp_notes)
                     self.state.mode = config.PLAYBACK_STATES["clear"]
 
             # Handle scale packet
-            elif packet_type == 'scale':
+            elif packet_type == config.PKT_SCALE:
                 scale_start, scale = args
                 self.state.update_scale(scale_start, scale)
                 if not self.state.mute:
@@ -554,79 +574,31 @@ class Arpeggiator:
 
 # ------10|-------20|-------30|-------40|-------50|-------60|-------70|-------80|
 
+# arp2d holds one bitmask per arp step, bit n set = key n active.
+# remove/add are the bitmask of the toggled key (or 0).
 def newKey(arp2d, key, pos):
-    remove = []
-    add = []
-    if key in arp2d[pos]:
-        arp2d[pos].remove(key)
-        remove.append(key)
+    bit = 1 << key
+    if arp2d[pos] & bit:
+        remove = bit
+        add = 0
     else:
-        arp2d[pos].append(key)
-        add.append(key)
+        remove = 0
+        add = bit
+    arp2d[pos] ^= bit
     old_pos = pos
     pos += 1
     if pos >= len(arp2d):
         pos = 0
     return(arp2d, pos, old_pos, remove, add)
 
-# unused...
-def update_ui(field, arp2d, pos):
-    # clear all leds
-    for i in range(12):
-        hw.pixels[i] = (0,0,0)
-    # clear field (slow, but fast enought)
-    for y in range(config.FIELD_Y_MAX):
-        for x in range(config.FIELD_X_MAX):
-            field.setBlock(x, y, 0)
-    # add new sprites and leds
-    for y, a in enumerate(arp2d):
-        for x in a:
-            if y != pos:
-                field.setBlock(x, y, 2)
-                hw.pixels[x] = 0x200010
-    for n in arp2d[pos]:
-        field.setBlock(n, pos, 1)
-        hw.pixels[n] = (0,20,10)
-    hw.display.refresh()
-
-# unused...
-def send_packet(id, payload, addr):
-    packet = bytearray(id, 'utf-8')
-    packet.extend(payload)
-    esp.send(packet, addr)
-
-# unused...
-def send_pair():
-    send_packet('p', [config.INSTRUMENT_ID], peer_broadcast)
-    #send_packet('p', bytearray(wifi.radio.mac_address), peer_broadcast)
-
-# Create and remove a black sprite to refresh the screen 
-# unused...
-def redraw():
-    black_sprite = displayio.TileGrid(displayio.Bitmap(160, 128, 1), pixel_shader=displayio.Palette(1), x=0, y=0)
-    hw.displayGroup.append(black_sprite)
-    hw.displayGroup.pop()
-    hw.display.refresh()
-
-def report_error(display_manager, error_msg, is_fatal=False):
-    """
-    Report an error to the display and console.
-    
-    Args:
-        display_manager: DisplayManager instance
-        error_msg: Error message to display
-        is_fatal: Whether this is a fatal error
-    """
-    # Always print to serial console
-    print(f"{'FATAL ERROR' if is_fatal else 'Error'}: {error_msg}")
-    
-    # Print to display if available
-    if display_manager:
-        try:
-            prefix = "FATAL: " if is_fatal else "Error: "
-            display_manager.show_debug_message(prefix + error_msg[:18])
-        except Exception as e:
-            print(f"Error displaying error message: {e}")
+# set the tile of every key in the bitmask on row y
+def setRow(field, mask, y, tile):
+    x = 0
+    while mask:
+        if mask & 1:
+            field.setBlock(x, y, tile)
+        mask >>= 1
+        x += 1
 
 def cleanup(display_manager, esp):
     """Cleanup resources."""
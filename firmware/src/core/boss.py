@@ -52,6 +52,7 @@ from src.common.ui import DisplayManager
 from src.common.network import PacketHandler, NetworkError, PacketSendError, PacketReadError, SongSendError
 from src.common.song import Song, SongPlayer
 from src.common.menu import MenuManager
+from src.common.errors import report_error
 
 # ------10|-------20|-------30|-------40|-------50|-------60|-------70|-------80|
 
@@ -112,11 +113,15 @@ def handle_song_playback(player, display_manager):
     try:
         result = player.update()
         if result:
-            sprite_pos, ch, note, intensity = result
+            sprite_pos = result[0]
             if sprite_pos > player.sprite_last_pos:
                 player.sprite_last_pos = sprite_pos
                 display_manager.update_playback_position(sprite_pos)
-            display_manager.update_channel_info(ch, note, intensity)
+            # Only repaint the channel info when it actually changed
+            channel_info = result[1:]
+            if channel_info != player.last_channel_info:
+                player.last_channel_info = channel_info
+                display_manager.update_channel_info(*channel_info)
         return result
     except IndexError as e:
         # Handle out of range errors gracefully
@@ -126,94 +131,84 @@ def handle_song_playback(player, display_manager):
         report_error(display_manager, f"Playback error: {e}")
         return None
 
-def handle_input(player, audio_manager, display_manager, menu_manager, song):
-    """Handle user input."""
+def handle_input(player, audio_manager, display_manager, menu_manager, mute_mask):
+    """Handle user input (mute_mask has one bit per song instrument)."""
     try:
+        # Read all keys once; each bit is a key pressed since the last scan
+        pressed = hw.scan_keys()
+
         # Handle reset button
-        if hw.key_new(config.KEY_RESET):
-            handle_reset(player, audio_manager, display_manager)
-            return
+        if pressed & (1 << config.KEY_RESET):
+            player.reset()
+            display_manager.update_mute_leds(audio_manager.get_mute_states())
+            display_manager.update_channel_info(0, 0, 0)
+            display_manager.update_playback_position(0)
+            display_manager.flush(full=True)
 
         # Handle play/pause button
-        if hw.key_new(config.KEY_PLAY_PAUSE):
-            handle_play_pause(player, display_manager)
-            return
+        if pressed & (1 << config.KEY_PLAY_PAUSE):
+            if player.playback_state == "playing":
+                player.pause()
+                display_manager.set_pause_led(True)
+            else:
+                player.play()
+                display_manager.set_pause_led(False)
 
-        # Handle mute toggles
-        for k in range(song.get_metadata('nr_instruments')):
-            if hw.key_new(k):
+        # Handle mute toggles (only walks up to the highest pressed channel key);
+        # reset and play/pause keys are handled above and never toggle a mute
+        bits = pressed & mute_mask & ~((1 << config.KEY_RESET) | (1 << config.KEY_PLAY_PAUSE))
+        k = 0
+        while bits:
+            if bits & 1:
                 handle_mute_toggle(k, audio_manager, display_manager)
-                return
+            bits >>= 1
+            k += 1
 
-        # Handle menu navigation
-        handle_menu_navigation(menu_manager)
+        # Handle menu navigation (keys used as channel mutes stay mutes)
+        handle_menu_navigation(menu_manager, pressed & ~mute_mask)
     except Exception as e:
         report_error(display_manager, f"Input error: {e}")
 
-def handle_reset(player, audio_manager, display_manager):
-    """Handle reset button press."""
-    player.reset()
-    display_manager.update_mute_leds(audio_manager.get_mute_states())
-    display_manager.update_channel_info(0, 0, 0)
-    display_manager.update_playback_position(0)
-
-def handle_play_pause(player, display_manager):
-    """Handle play/pause button press."""
-    if player.playback_state == "playing":
-        player.pause()
-        display_manager.set_pause_led(True)
-    else:
-        player.play()
-        display_manager.set_pause_led(False)
-
 def handle_mute_toggle(channel, audio_manager, display_manager):
     """Handle mute toggle for a channel."""
     audio_manager.toggle_mute(channel)
     display_manager.update_mute_leds(audio_manager.get_mute_states())
 
-def handle_menu_navigation(menu_manager):
-    """Handle menu navigation input."""
-    rotation = 0  # Initialize rotation to 0
-    
-    if config.HW_VERSION == 1.1:
-        rotation = hw.check_rotation(0, 512)
-    elif config.HW_VERSION == 1.0:
-        if hw.check_analog_rotation(config.ROTATION_CW):
-            rotation = 1
-        elif hw.check_analog_rotation(config.ROTATION_CCW):
-            rotation = -1
-    
+def handle_menu_navigation(menu_manager, pressed):
+    """Handle menu navigation input (pressed is the key bitmask from hw.scan_keys)."""
+    rotation = hw.menu_rotation()
     if rotation:
         menu_manager.handle_rotation(rotation)
-    if hw.key_new(config.KEY_BACK):
+    if pressed & (1 << config.KEY_BACK):
         menu_manager.handle_back()
-    if hw.key_new(config.KEY_SELECT):
+    if pressed & (1 << config.KEY_SELECT):
         menu_manager.handle_select()
 
 def handle_network_packets(esp, packet_handler, audio_manager, display_manager, player):
-    """Handle incoming network packets."""
+    """Handle incoming network packets. Returns True if a packet was handled."""
     if not esp:
-        return
+        return False
         
     try:
         packet = esp.read()
         if not packet:
-            return
+            return False
             
         result = packet_handler.handle_packet(packet)
         if not result:
-            return
+            return True
             
-        if result[0] == 'live':
-            _, ch, note, intensity = result
-            audio_manager.play.event(ch, note, intensity)
+        if result[0] == config.PKT_LIVE:
+            for ch, note, intensity in packet_handler.live_frames(packet):
+                audio_manager.play.event(ch, note, intensity)
+            # keep playback's change check in step with what is on screen
+            player.last_channel_info = (ch, note, intensity)
             display_manager.update_channel_info(ch, note, intensity)
-        elif result[0] == 'pair':
+        elif result[0] == config.PKT_PAIR:
             _, id = result
-            # Read the song file and send it to the requesting device
-            with open(player.song.file_path + player.song.file_name + ".bin", 'rb') as f:
-                byte_song = f.read()
-                packet_handler.send_song(id, byte_song, display_manager, hw)
+            # Send the song to the requesting device (file is read once and cached)
+            packet_handler.send_song(id, player.get_song_bytes(), display_manager, hw)
+        return True
     except PacketReadError as e:
         report_error(display_manager, f"Packet read error: {e}")
     except PacketSendError as e:
@@ -253,27 +248,6 @@ def cleanup(audio_manager, display_manager, esp):
     except Exception as e:
         report_error(display_manager, f"Cleanup error: {e}")
 
-def report_error(display_manager, error_msg, is_fatal=False):
-    """
-    Report an error to the display and console.
-    
-    Args:
-        display_manager: DisplayManager instance
-        error_msg: Error message to display
-        is_fatal: Whether this is a fatal error
-    """
-    # Always print to serial console
-    print(f"{'FATAL ERROR' if is_fatal else 'Error'}: {error_msg}")
-    
-    # Print to display if available
-    if display_manager:
-        try:
-            prefix = "FATAL: " if is_fatal else "Error: "
-            display_manager.show_debug_message(prefix + error_msg[:18])
-        except Exception as e:
-            print(f"Error displaying error message: {e}")
-
-
 # ------10|-------20|-------30|-------40|-------50|-------60|-------70|-------80|
 
 def main():
@@ -301,6 +275,9 @@ def main():
             report_error(display_manager, f"Song init error: {e}", True)
             raise
 
+        # Channel mute keys, fixed for the loaded song
+        mute_mask = (1 << song.get_metadata('nr_instruments')) - 1
+
         # Set initial LED states
         display_manager.set_pause_led(True)
         display_manager.update_mute_leds(audio_manager.get_mute_states())
@@ -308,9 +285,15 @@ def main():
         # Main loop
         while True:
             try:
-                handle_song_playback(player, display_manager)
-                handle_input(player, audio_manager, display_manager, menu_manager, song)
-                handle_network_packets(esp, packet_handler, audio_manager, display_manager, player)
+                # One display refresh per iteration, however many updates happen
+                with display_manager.batched():
+                    handle_song_playback(player, display_manager)
+                    handle_input(player, audio_manager, display_manager, menu_manager, mute_mask)
+                    received = handle_network_packets(esp, packet_handler, audio_manager, display_manager, player)
+
+                # Nothing to play and nothing received: sleep instead of spinning
+                if not received and player.playback_state != "playing":
+                    time.sleep(config.NETWORK_IDLE_SLEEP)
             except KeyboardInterrupt:
                 report_error(display_manager, "User interrupted")
                 break
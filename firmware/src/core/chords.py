@@ -36,6 +36,7 @@ import adafruit_midi
 from src.common.network import PacketHandler
 from src.common.ui import DisplayManager, Sprite, Image, colorwheel
 from src.common.menu import MenuManager
+from src.common.errors import report_error
 
 class ChordConfig:
     """Configuration management for chord playback."""
@@ -51,27 +52,42 @@ class ChordConfig:
 # Initialize configuration
 chord_config = ChordConfig()
 
+_monotonic_ns = time.monotonic_ns   # bound once for the playback hot path
+
+# Root LED colour per octave (MIDI notes 0-127 span octaves 0-10)
+_ROOT_COLOR = tuple(colorwheel(octave * 20 & 255) for octave in range(11))
+
 class ChordLEDManager:
     """Manages LED states for chord visualization."""
     def __init__(self, nr_keys):
         self.nr_keys = nr_keys
+        self.colors = [0x000000] * nr_keys  # frame buffer, pushed to the LEDs in one write
 
     def clear_all(self):
         """Clear all LEDs."""
-        for i in range(self.nr_keys):
-            hw.pixels[i] = 0x000000
+        hw.pixels.fill(0x000000)
+        hw.pixels.show()
 
     def set_chord_leds(self, chord):
         """Set LEDs for a chord pattern."""
-        # Clear all LEDs first
-        self.clear_all()
-        
-        # Set chord pattern LEDs
+        colors = self.colors
+        root = chord[1]
+
+        # Collect the chord pattern as a bitmask of LED indices
+        mask = 0
         for i in range(2, 9):
-            hw.pixels[(chord[1] + chord[i]) % 12] = 0x200010
+            mask |= 1 << ((root + chord[i]) % 12)
+
+        # Fill all LEDs in a single pass (pattern LEDs lit, the rest cleared)
+        for i in range(self.nr_keys):
+            colors[i] = 0x200010 if mask & (1 << i) else 0x000000
         
         # Set root note LED with color based on octave
-        hw.pixels[chord[1] % 12] = colorwheel(int(chord[1] / 12) * 20 & 255)
+        colors[root % 12] = _ROOT_COLOR[root // 12]
+
+        # Push the whole frame at once
+        hw.pixels[0:self.nr_keys] = colors
+        hw.pixels.show()
 
 class ChordNetworkHandler:
     """Handles all network-related operations for chord playback."""
@@ -79,21 +95,25 @@ class ChordNetworkHandler:
         self.packet_handler = PacketHandler(esp, instrument_id, peer_broadcast)
         self.esp = esp
         self.peer_broadcast = peer_broadcast
+        # Packets are built once and filled in place on each send
+        self.chord_packet = bytearray(10)   # 'n' + 9 chord bytes
+        self.chord_packet[0] = ord('n')
+        self.note_packet = bytearray(4)     # 'l' + channel, note, intensity
+        self.note_packet[0] = ord('l')
+        self.note_packet[1] = instrument_id
 
     def send_chord(self, chord):
         """Send a chord packet."""
-        packet = bytearray()
-        packet.append(ord('n'))
-        packet.extend(bytearray(chord))
+        packet = self.chord_packet
+        for i in range(9):
+            packet[i + 1] = chord[i]
         self.esp.send(packet, self.peer_broadcast)
 
     def send_note(self, note, intensity):
         """Send a note packet."""
-        packet = bytearray()
-        packet.append(ord('l'))
-        packet.append(chord_config.instrument_id)
-        packet.append(note)
-        packet.append(intensity)
+        packet = self.note_packet
+        packet[2] = note
+        packet[3] = intensity
         self.esp.send(packet, self.peer_broadcast)
 
     def read_packet(self):
@@ -114,6 +134,10 @@ if chord_config.mode == "chords":
     peer_broadcast = espnow.Peer(mac=chord_config.mac_broadcast)
     esp.peers.append(peer_broadcast)
     network_handler = ChordNetworkHandler(esp, chord_config.instrument_id, peer_broadcast)
+else:
+    esp = None
+    network_handler = None
+_HAS_NET = network_handler is not None   # fixed at import, checked in the loops
 
 # Initialize LED manager
 led_manager = ChordLEDManager(chord_config.nr_keys)
@@ -129,13 +153,18 @@ class TimingManager:
         self.max_tick = 47522
         self.tempo = 160
         self.denominator = 4
-        self.start_time = time.monotonic()
+        self.start_ns = time.monotonic_ns()
         self._update_timing()
 
     def _update_timing(self):
         """Update timing calculations."""
         self.tick_to_time = (60 * 4) / (self.tempo * self.ticks_per_beat * self.denominator)
         self.time_to_tick = (self.tempo * self.ticks_per_beat * self.denominator) / (60 * 4)
+        # Exact integer conversion: tick = elapsed_ns * tick_num // tick_den
+        self.tick_num = self.tempo * self.ticks_per_beat * self.denominator
+        self.tick_den = 60 * 4 * 1000000000
+        self.arp_bar = self.ticks_per_beat * 4          # ticks per chord
+        self.arp_period = self.ticks_per_beat * 16      # ticks per chord progression
 
     def update_from_packet(self, args):
         """Update timing from packet data."""
@@ -149,11 +178,11 @@ class TimingManager:
 
     def get_current_tick(self):
         """Get current tick based on elapsed time."""
-        return int(self.time_to_tick * (time.monotonic() - self.start_time))
+        return (time.monotonic_ns() - self.start_ns) * self.tick_num // self.tick_den
 
     def reset(self):
         """Reset timing to start."""
-        self.start_time = time.monotonic()
+        self.start_ns = time.monotonic_ns()
 
 class ChordState:
     """State management for chord playback."""
@@ -198,6 +227,18 @@ class ChordPlayer:
         self.display_manager = display_manager
         self.state = ChordState()
         self.chord_manager = ChordManager()
+        # Packet dispatch table, built once
+        self.packet_handlers = {
+            config.PKT_TICK: self._handle_tick_packet,
+            config.PKT_BEGIN: self._handle_begin_packet,
+            config.PKT_STOP: self._handle_stop_packet,
+            config.PKT_HEADER: self._handle_header_packet,
+            config.PKT_LIVE: self._handle_live_packet,
+            config.PKT_MUTE: self._handle_mute_packet,
+            config.PKT_UPDATE: self._handle_update_packet,
+            config.PKT_RESET: self._handle_reset_packet,
+            config.PKT_CLEAR: self._handle_clear_packet
+        }
 
     def _update_display(self, chord, arp_pos):
         """Update display with current chord and position."""
@@ -209,28 +250,32 @@ class ChordPlayer:
 
     def handle_playback(self):
         """Handle chord playback and display updates."""
-        if self.state.mode != self.state.modes["playing"]:
+        state = self.state
+        if state.mode != state.modes["playing"]:
             return
 
-        now = time.monotonic()
-        arp_tick = int(((now - self.state.timing.start_time) * self.state.timing.time_to_tick + self.state.tick_offset) % 
-                      (self.state.timing.ticks_per_beat * 16))
-        self.state.arp_pos_new = int(arp_tick/(self.state.timing.ticks_per_beat*4))
+        # Bind hot attributes to locals once per call
+        timing = state.timing
+        arp_pos = state.arp_pos
+        arp_tick = ((_monotonic_ns() - timing.start_ns) * timing.tick_num // timing.tick_den + state.tick_offset) % timing.arp_period
+        arp_pos_new = arp_tick // timing.arp_bar
+        state.arp_pos_new = arp_pos_new
         
-        if self.state.arp_pos_new > self.state.arp_pos or (self.state.arp_pos == 3 and self.state.arp_pos_new == 0):
-            chord = self.chord_manager.get_current_chord(self.state.bar_count)
+        if arp_pos_new > arp_pos or (arp_pos == 3 and arp_pos_new == 0):
+            chord = self.chord_manager.get_current_chord(state.bar_count)
             new_chord(chord, False)
 
-            print("arp_tick", arp_tick, "arp_pos_new", self.state.arp_pos_new, "arp_pos", self.state.arp_pos)
-            self.state.arp_pos = self.state.arp_pos_new
-            self.state.bar_count += 1
+            if config.DEBUG:
+                print("arp_tick", arp_tick, "arp_pos_new", arp_pos_new, "arp_pos", arp_pos)
+            state.arp_pos = arp_pos_new
+            state.bar_count += 1
             
             if self.display_manager:
-                self._update_display(chord, self.state.arp_pos_new)
+                self._update_display(chord, arp_pos_new)
 
     def handle_packet(self, packet):
         """Handle incoming network packets."""
-        if not packet or not network_handler:
+        if not packet or not _HAS_NET:
             return
 
         result = network_handler.handle_packet(packet)
@@ -238,90 +283,83 @@ class ChordPlayer:
             return
 
         packet_type, *args = result
-        
-        if packet_type == 'tick':
-            tick = args[0]
-            now_tick = self.state.timing.get_current_tick()
-            self.state.timing.tick_delta = tick - now_tick
-            
-        elif packet_type == 'begin':
-            self.state.timing.reset()
-            self.state.mode = self.state.modes["playing"]
+        handler = self.packet_handlers.get(packet_type)
+        if handler:
+            handler(*args)
+
+    def _handle_tick_packet(self, tick):
+        """Handle tick packet for synchronization."""
+        now_tick = self.state.timing.get_current_tick()
+        self.state.timing.tick_delta = tick - now_tick
+
+    def _handle_begin_packet(self):
+        """Handle begin packet to start playback."""
+        self.state.timing.reset()
+        self.state.mode = self.state.modes["playing"]
+        if self.display_manager:
+            self.display_manager.show_debug_message("playing")
+
+    def _handle_stop_packet(self):
+        """Handle stop packet to pause playback."""
+        self.state.mode = self.state.modes["paused"]
+        if self.display_manager:
+            self.display_manager.show_debug_message("paused")
+
+    def _handle_header_packet(self, *args):
+        """Handle header packet containing song metadata."""
+        self.state.timing.update_from_packet(args)
+
+    def _handle_live_packet(self, ch, note, intensity):
+        """Handle live packet (sets mute state for this channel)."""
+        if ch == chord_config.instrument_id:
+            self.state.mute = intensity
             if self.display_manager:
-                self.display_manager.show_debug_message("playing")
-            
-        elif packet_type == 'stop':
-            self.state.mode = self.state.modes["paused"]
-            if self.display_manager:
-                self.display_manager.show_debug_message("paused")
-            
-        elif packet_type == 'header':
-            self.state.timing.update_from_packet(args)
-            
-        elif packet_type == 'live':
-            ch, note, intensity = args
-            if ch == chord_config.instrument_id:
-                self.state.mute = intensity
-                if self.display_manager:
-                    self.display_manager.show_debug_message("muted" if self.state.mute else " ")
-                
-        elif packet_type == 'mute':
-            ch, intensity = args
-            if ch == chord_config.instrument_id:
-                self.state.mute = intensity
-                if self.display_manager:
-                    self.display_manager.show_debug_message("muted" if self.state.mute else " ")
-                
-        elif packet_type == 'update':
+                self.display_manager.show_debug_message("muted" if self.state.mute else " ")
+
+    def _handle_mute_packet(self, ch, intensity):
+        """Handle mute packet to control output."""
+        if ch == chord_config.instrument_id:
+            self.state.mute = intensity
             if self.display_manager:
-                self.display_manager.show_debug_message("update")
+                self.display_manager.show_debug_message("muted" if self.state.mute else " ")
+
+    def _handle_update_packet(self):
+        """Handle update packet to refresh display."""
+        if self.display_manager:
+            # Only the final state is ever visible, so skip the transient "update" text
+            with self.display_manager.batched():
                 self.display_manager.show_debug_message(" ")
                 self.display_manager.sprites['background'].clear(0)
                 self.display_manager.update_channel_info(0, 0, 0)
-            
-        elif packet_type == 'reset':
-            self.state.timing.reset()
-            if self.display_manager:
+
+    def _handle_reset_packet(self):
+        """Handle reset packet to restart playback."""
+        self.state.timing.reset()
+        self.state.arp_pos = 3
+        self.state.bar_count = 0
+        chord = self.chord_manager.get_chord(0)
+        new_chord(chord, True)
+        if self.display_manager:
+            with self.display_manager.batched():
                 self.display_manager.show_debug_message("reset")
-            self.state.arp_pos = 3
-            self.state.bar_count = 0
-            chord = self.chord_manager.get_chord(0)
-            new_chord(chord, True)
-            if self.display_manager:
                 self.display_manager.update_channel_info(0, 0, 0)
                 self.display_manager.sprites['background'].replace("assets/images/chord0.bmp")
-            
-        elif packet_type == 'clear':
-            if args[0] == chord_config.instrument_id or args[0] == 255:
-                self.state.mode = self.state.modes["clear"]
 
-def report_error(display_manager, error_msg, is_fatal=False):
-    """
-    Report an error to the display and console.
-    
-    Args:
-        display_manager: DisplayManager instance
-        error_msg: Error message to display
-        is_fatal: Whether this is a fatal error
-    """
-    # Always print to serial console
-    print(f"{'FATAL ERROR' if is_fatal else 'Error'}: {error_msg}")
-    
-    # Print to display if available
-    if display_manager:
-        try:
-            prefix = "FATAL: " if is_fatal else "Error: "
-            display_manager.show_debug_message(prefix + error_msg[:18])
-        except Exception as e:
-            print(f"Error displaying error message: {e}")
+    def _handle_clear_packet(self, id):
+        """Handle clear packet to reset the song."""
+        if id == chord_config.instrument_id or id == 255:
+            self.state.mode = self.state.modes["clear"]
 
 def initialize_display():
     """Initialize display components."""
     try:
         display_manager = DisplayManager(hw.display, hw)
         
-        # Load initial background
-        display_manager.sprites['background'] = Image(display_manager.display_group, "assets/images/chord0.bmp")
+        # Load initial background, keeping the chord backgrounds decoded in RAM
+        # since they are swapped on every chord change
+        display_manager.sprites['background'] = Image(display_manager.display_group, "assets/images/chord0.bmp",
+                                                   refresh=display_manager.refresh,
+                                                   preload_paths=[f"assets/images/chord{i}.bmp" for i in range(4)])
         
         return display_manager
     except Exception as e:
@@ -332,20 +370,21 @@ def initialize_display():
 def new_chord(chord, mute):
     """Handle new chord events."""
     global old_note
-    print("chord", chord)
+    if config.DEBUG:
+        print("chord", chord)
     
     # Send chord packet
-    if network_handler:
+    if _HAS_NET:
         network_handler.send_chord(chord)
 
     if not mute:
         if old_note != 0:
             # Turn off previous note
-            if network_handler:
+            if _HAS_NET:
                 network_handler.send_note(old_note, 0)
 
         # Send new note
-        if network_handler:
+        if _HAS_NET:
             network_handler.send_note(chord[0], chord_config.default_intensity)
         old_note = chord[0]
 
@@ -364,6 +403,9 @@ def main():
             report_error(None, "Failed to initialize display", True)
             return
 
+        # LEDs are written as whole frames by the LED manager (see ChordLEDManager)
+        hw.pixels.auto_write = False
+
         # Initialize menu manager
         menu_manager = MenuManager(config.MENU_FILE, display_manager)
         if not menu_manager:
@@ -379,44 +421,44 @@ def main():
             return
         
         # Send pair request if network is initialized
-        if 'network_handler' in globals():
+        if _HAS_NET:
             network_handler.send_pair()
 
         while True:
             try:
-                # Handle playback
-                if player:
-                    player.handle_playback()
-
-                # Handle network packets
-                if esp and 'network_handler' in globals():
-                    packet = network_handler.read_packet()
-                    if packet:
-                        print(packet)
-                        if player:
-                            player.handle_packet(packet)
-
-                # Handle menu navigation
-                if menu_manager:
-                    try:
-                        rotation = 0  # Initialize rotation to 0
-                        
-                        if chord_config.hw_version == 1.1:
-                            rotation = hw.check_rotation(0, 512)
-                        elif chord_config.hw_version == 1.0:
-                            if hw.check_rotation(config.ROTATION_CW):
-                                rotation = 1
-                            elif hw.check_rotation(config.ROTATION_CCW):
-                                rotation = -1
-                        
-                        if rotation:
-                            menu_manager.handle_rotation(rotation)
-                        if hw.key_new(config.KEY_BACK):
-                            menu_manager.handle_back()
-                        if hw.key_new(config.KEY_SELECT):
-                            menu_manager.handle_select()
-                    except Exception as e:
-                        report_error(display_manager, f"Menu navigation error: {e}")
+                # One display refresh per iteration, however many updates happen
+                with display_manager.batched():
+                    # Handle playback
+                    if player:
+                        player.handle_playback()
+
+                    # Handle network packets
+                    packet = None
+                    if _HAS_NET:
+                        packet = network_handler.read_packet()
+                        if packet:
+                            if config.DEBUG:
+                                print(packet)
+                            if player:
+                                player.handle_packet(packet)
+
+                    # Handle menu navigation
+                    if menu_manager:
+                        try:
+                            rotation = hw.menu_rotation()
+                            if rotation:
+                                menu_manager.handle_rotation(rotation)
+                            pressed = hw.scan_keys()
+                            if pressed & (1 << config.KEY_BACK):
+                                menu_manager.handle_back()
+                            if pressed & (1 << config.KEY_SELECT):
+                                menu_manager.handle_select()
+                        except Exception as e:
+                            report_error(display_manager, f"Menu navigation error: {e}")
+
+                # Nothing to play and nothing received: sleep instead of spinning
+                if not packet and player.state.mode != player.state.modes["playing"]:
+                    time.sleep(config.NETWORK_IDLE_SLEEP)
 
             except Exception as e:
                 report_error(display_manager, f"Main loop error: {e}")
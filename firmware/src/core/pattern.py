@@ -41,12 +41,14 @@ from src.common.ui import DisplayManager, Field
 from src.common.network import PacketHandler, PacketReadError
 from src.common.menu import MenuManager
 from src.common.song import LocalSong
+from src.common.errors import report_error
 
 # load config
 MODE = config.MODE
 INSTRUMENT_ID = config.INSTRUMENT_ID
 MIDI_CHANNEL = config.MIDI_CHANNEL
 DEFAULT_INTENSITY = config.DEFAULT_INTENSITY
+_monotonic = time.monotonic
 midi = adafruit_midi.MIDI(midi_out=usb_midi.ports[1], out_channel=MIDI_CHANNEL-1)
 
 if MODE == "pattern":
@@ -55,13 +57,43 @@ if MODE == "pattern":
     esp.peers.append(peer_broadcast)
     packet_handler = PacketHandler(esp, INSTRUMENT_ID, peer_broadcast)
 
+# playback modes (same values as config.MODES)
+MODE_PAUSED = 0
+MODE_PLAYING = 1
+MODE_RESET = 2
+MODE_CLEAR = 3
+_VALID_MODES = (MODE_PAUSED, MODE_PLAYING, MODE_RESET, MODE_CLEAR)
+
+# field sprite ids (tiles in assets/images/10x10.bmp)
+_BLOCK_BLACK = 0
+_BLOCK_RED = 1
+_BLOCK_BLUE = 2
+_BLOCK_LRED = 3
+_BLOCK_LBLUE = 4
+_BLOCK_WHITE = 5
+
+# step LED colors
+_PX_OFF = (0, 0, 0)
+_PX_GREEN = (18, 70, 23)      # step set for the selected drum
+_PX_WHITE = (200, 200, 200)   # cursor on a set step
+_PX_PURPLE = (14, 0, 20)      # cursor on an empty step
+
+# mute LED states, shared instead of building a new list per update
+_ALL_MUTED = (True,) * 12
+_NONE_MUTED = (False,) * 12
+
+# menu keys, their presses go to the menu and never toggle a step
+_KEY_MENU_SELECT = 12
+_KEY_MENU_BACK = 13
+_STEP_KEYS = 0xFFFFF & ~((1 << _KEY_MENU_SELECT) | (1 << _KEY_MENU_BACK))  # keys 0-19
+
 class PatternState:
     """
     A class for managing pattern mode state.
     
     Attributes:
         instrument_id: ID of the instrument
-        mode: Current mode (paused, playing, reset, clear)
+        mode: Current mode (MODE_PAUSED, MODE_PLAYING, MODE_RESET, MODE_CLEAR)
         song_index: Current position in song
         selected_channel: Selected channel
         is_muted: Mute state
@@ -70,12 +102,13 @@ class PatternState:
         needs_display_update: Flag for display update
         tick_delta: Time delta for ticks
         playback_start_time: Start time for playback
+        channel_info: Last (channel, note, intensity) shown on the display
     """
     
     def __init__(self, instrument_id: int):
         """Initialize pattern state."""
         self.instrument_id = instrument_id
-        self.mode = "clear"
+        self.mode = MODE_CLEAR
         self.song_index = 0
         self.selected_channel = 0
         self.is_muted = 0
@@ -84,8 +117,9 @@ class PatternState:
         self.needs_display_update = 0
         self.tick_delta = 0
         self.playback_start_time = time.monotonic()
+        self.channel_info = (0, 0, 0)
 
-    def set_mode(self, mode: str) -> None:
+    def set_mode(self, mode: int) -> None:
         """
         Set the pattern mode.
         
@@ -95,7 +129,7 @@ class PatternState:
         Raises:
             PatternStateError: If mode is invalid
         """
-        if mode not in config.MODES:
+        if mode not in _VALID_MODES:
             raise PatternStateError(f"Invalid mode: {mode}")
         self.mode = mode
 
@@ -115,11 +149,12 @@ class PatternHardware:
         self.drum_notes = config.DRUM_NOTES
         self.drum_names = config.DRUM_NAMES
     
-    def handle_key_input(self, pixel_pos: int, selected_channel: int, song: LocalSong, state: PatternState, field: Field, display_manager: DisplayManager) -> bool:
+    def handle_key_input(self, pressed: int, pixel_pos: int, selected_channel: int, song: LocalSong, state: PatternState, field: Field, display_manager: DisplayManager) -> bool:
         """
         Handle key input for pattern editing.
         
         Args:
+            pressed: Bitmask of newly pressed keys from hw.scan_keys()
             pixel_pos: Current pixel position
             selected_channel: Selected channel
             song: LocalSong instance
@@ -130,36 +165,40 @@ class PatternHardware:
         Returns:
             bool: True if key was pressed, False otherwise
         """
-        for i in range(20):
-            if self.hw.key_new(i):
-                roll_position = i + pixel_pos - pixel_pos % 16
-                print("key:", str(i), song.pattern_roll[roll_position])
-                if not self.drum_notes[selected_channel] in song.pattern_roll[roll_position]:
-                    song.pattern_roll[roll_position].append(self.drum_notes[selected_channel])
-                    forced_update = True
-                    state.previous_pixel = update_roll(pixel_pos, state.previous_pixel, selected_channel, forced_update, song.pattern_roll, field)
-                    self.hw.display.refresh()
-                else:
-                    song.pattern_roll[roll_position].remove(self.drum_notes[selected_channel])
-                    forced_update = True
-                    state.previous_pixel = update_roll(pixel_pos, state.previous_pixel, selected_channel, forced_update, song.pattern_roll, field)
-                    self.hw.display.refresh()
-                return True
-        return False
-    
-    def handle_menu_navigation(self, menu_manager: MenuManager) -> None:
+        bits = pressed & _STEP_KEYS
+        if not bits:
+            return False
+        page_start = pixel_pos - pixel_pos % 16
+        i = 0
+        while bits:
+            if bits & 1:
+                roll_position = i + page_start
+                if config.DEBUG:
+                    print("key:", str(i), song.pattern_roll[roll_position])
+                # toggle the selected drum at this position
+                song.pattern_roll[roll_position] ^= 1 << selected_channel
+            bits >>= 1
+            i += 1
+        # one redraw for all keys pressed in this scan
+        forced_update = True
+        state.previous_pixel = update_roll(pixel_pos, state.previous_pixel, selected_channel, forced_update, song.pattern_roll, field)
+        display_manager.refresh()
+        return True
+    
+    def handle_menu_navigation(self, menu_manager: MenuManager, pressed: int) -> None:
         """
         Handle menu navigation.
         
         Args:
             menu_manager: MenuManager instance
+            pressed: Bitmask of newly pressed keys from hw.scan_keys()
         """
         rotation = self.hw.check_rotation(0, config.DISPLAY_REFRESH_RATE)
         if rotation != 0:
             menu_manager.handle_rotation(rotation)
-        if self.hw.key_new(13):  # menu back
+        if pressed & (1 << _KEY_MENU_BACK):
             menu_manager.handle_back()
-        if self.hw.key_new(12):  # menu select
+        if pressed & (1 << _KEY_MENU_SELECT):
             menu_manager.handle_select()
     
     def handle_drum_selection(self, state: PatternState, song: LocalSong, field: Field, display_manager: DisplayManager) -> None:
@@ -181,7 +220,7 @@ class PatternHardware:
             display_manager.text_fields['title'].showText(self.drum_names[state.selected_channel])
             forced_update = True
             state.previous_pixel = update_roll(state.current_pixel, state.previous_pixel, state.selected_channel, forced_update, song.pattern_roll, field)
-            self.hw.display.refresh()
+            display_manager.refresh()
         # previous drum (ccw)
         elif rotation == -1:
             state.selected_channel += 1
@@ -190,7 +229,7 @@ class PatternHardware:
             display_manager.text_fields['title'].showText(self.drum_names[state.selected_channel])
             forced_update = True
             state.previous_pixel = update_roll(state.current_pixel, state.previous_pixel, state.selected_channel, forced_update, song.pattern_roll, field)
-            self.hw.display.refresh()
+            display_manager.refresh()
 
 # Forward declaration of PatternDisplay to allow type annotations
 class PatternDisplay:
@@ -209,11 +248,13 @@ class PatternPacketHandler:
         song: LocalSong instance
         state: PatternState instance
         pattern_display: PatternDisplay instance
+        pattern_playback: PatternPlayback instance
     """
     
     def __init__(self, packet_handler: PacketHandler, instrument_id: int, 
                  display_manager: DisplayManager, field: Field, 
-                 song: LocalSong, state: PatternState, pattern_display: PatternDisplay):
+                 song: LocalSong, state: PatternState, pattern_display: PatternDisplay,
+                 pattern_playback: 'PatternPlayback'):
         """Initialize pattern packet handler."""
         self.packet_handler = packet_handler
         self.instrument_id = instrument_id
@@ -222,7 +263,19 @@ class PatternPacketHandler:
         self.song = song
         self.state = state
         self.pattern_display = pattern_display
-        self.modes = config.MODES
+        self.pattern_playback = pattern_playback
+        # Packet dispatch table, built once; every handler gets the full result tuple
+        self.packet_handlers = {
+            config.PKT_TICK: self._handle_tick_packet,
+            config.PKT_BEGIN: self._handle_begin_packet,
+            config.PKT_STOP: self._handle_stop_packet,
+            config.PKT_HEADER: self._handle_header_packet,
+            config.PKT_MUTE: self._handle_mute_packet,
+            config.PKT_UPDATE: self._handle_update_packet,
+            config.PKT_RESET: self._handle_reset_packet,
+            config.PKT_CLEAR: self._handle_clear_packet,
+            config.PKT_EVENT: self._handle_event_packet
+        }
     
     def handle_packet(self, packet) -> None:
         """
@@ -240,53 +293,39 @@ class PatternPacketHandler:
                 
             result = self.packet_handler.handle_packet(packet)
             if result:
-                if result[0] == 'tick':
-                    self._handle_tick_packet(result)
-                elif result[0] == 'begin':
-                    self._handle_begin_packet(result)
-                elif result[0] == 'stop':
-                    self._handle_stop_packet(result)
-                elif result[0] == 'header':
-                    self._handle_header_packet(result)
-                elif result[0] == 'mute':
-                    self._handle_mute_packet(result)
-                elif result[0] == 'update':
-                    self._handle_update_packet()
-                elif result[0] == 'reset':
-                    self._handle_reset_packet()
-                elif result[0] == 'clear':
-                    self._handle_clear_packet(result)
-                elif result[0] == 'event':
-                    self._handle_event_packet(result)  # Pass the full result tuple
+                handler = self.packet_handlers.get(result[0])
+                if handler:
+                    handler(result)
         except Exception as e:
             raise PatternPacketError(f"Failed to handle packet: {str(e)}") from e
     
     def _handle_tick_packet(self, packet) -> None:
         """Handle tick packet."""
-        # packet is a tuple: ('tick', tick)
+        # packet is a tuple: (PKT_TICK, tick)
         _, tick = packet
-        now_tick = int(time_to_tick * (time.monotonic() - self.state.playback_start_time))
+        now_tick = int(time_to_tick * (_monotonic() - self.state.playback_start_time))
         self.state.tick_delta = tick - now_tick
-        print("now", now_tick, "in_tick", tick, "delta", self.state.tick_delta)
+        if config.DEBUG:
+            print("now", now_tick, "in_tick", tick, "delta", self.state.tick_delta)
     
     def _handle_begin_packet(self, packet) -> None:
         """Handle begin packet."""
-        # packet is a tuple: ('begin',)
-        self.state.playback_start_time = time.monotonic() - self.song.get_event(self.state.song_index)[0] * tick_to_time   
-        self.state.mode = self.modes["playing"]
+        # packet is a tuple: (PKT_BEGIN,)
+        self.state.playback_start_time = _monotonic() - self.song.get_event(self.state.song_index)[0] * tick_to_time   
+        self.state.mode = MODE_PLAYING
         self.display_manager.show_debug_message("playing")
-        self.display_manager.hw.display.refresh()
+        self.display_manager.refresh()
     
     def _handle_stop_packet(self, packet) -> None:
         """Handle stop packet."""
-        # packet is a tuple: ('stop',)
-        self.state.mode = self.modes["paused"]
+        # packet is a tuple: (PKT_STOP,)
+        self.state.mode = MODE_PAUSED
         self.display_manager.show_debug_message("paused")
-        self.display_manager.hw.display.refresh()
+        self.display_manager.refresh()
     
     def _handle_header_packet(self, packet) -> None:
         """Handle header packet."""
-        # packet is a tuple: ('header', ticks_per_beat, max_tick, tempo, numerator, denominator, nr_instruments)
+        # packet is a tuple: (PKT_HEADER, ticks_per_beat, max_tick, tempo, numerator, denominator, nr_instruments)
         _, ticks_per_beat, max_tick, tempo, numerator, denominator, nr_instruments = packet
         self.song.update_header(ticks_per_beat, max_tick, tempo, numerator, denominator, nr_instruments)
         # Update local timing variables from song metadata
@@ -297,71 +336,71 @@ class PatternPacketHandler:
         sprite_tick = self.song.get_metadata('sprite_tick')
         sprite_time = self.song.get_metadata('sprite_time')
         max_pixels = self.song.get_metadata('max_pixels')
-        self.state.mode = self.modes["paused"]
+        self.pattern_playback.refresh_metadata()
+        self.state.mode = MODE_PAUSED
     
     def _handle_mute_packet(self, packet) -> None:
         """Handle mute packet."""
-        # packet is a tuple: ('mute', ch, intensity)
+        # packet is a tuple: (PKT_MUTE, ch, intensity)
         _, ch, intensity = packet
         if ch == self.instrument_id:
             self.state.is_muted = intensity
             if self.state.is_muted:
-                self.display_manager.update_mute_leds([True] * 12)
+                self.display_manager.update_mute_leds(_ALL_MUTED)
                 self.display_manager.show_debug_message("muted")
-                self.display_manager.hw.display.refresh()
+                self.display_manager.refresh()
             else:
-                self.display_manager.update_mute_leds([False] * 12)
+                self.display_manager.update_mute_leds(_NONE_MUTED)
                 self.display_manager.show_debug_message(" ")
-                self.display_manager.hw.display.refresh()
+                self.display_manager.refresh()
     
-    def _handle_update_packet(self) -> None:
+    def _handle_update_packet(self, packet) -> None:
         """Handle update packet."""
-        # packet is a tuple: ('update',)
+        # packet is a tuple: (PKT_UPDATE,)
         self.display_manager.show_debug_message("update")
         self.display_manager.show_debug_message(" ")
-        redraw()
         self.pattern_display.update_display()
     
-    def _handle_reset_packet(self) -> None:
+    def _handle_reset_packet(self, packet) -> None:
         """Handle reset packet."""
-        # packet is a tuple: ('reset',)
-        self.field.reset(0)
+        # packet is a tuple: (PKT_RESET,)
+        self.field.reset(_BLOCK_BLACK)
         self.state.song_index = 0
         if self.song.get_event_count() > 0:
             event = self.song.get_event(0)
             if event:
-                self.state.playback_start_time = time.monotonic() - event[0] * tick_to_time   
+                self.state.playback_start_time = _monotonic() - event[0] * tick_to_time   
         self.state.current_pixel = 0
         self.state.previous_pixel = 15
         self.display_manager.show_debug_message("reset")
         self.pattern_display.update_display()
+        # the whole field was reset, so repaint the full screen
+        self.display_manager.flush(full=True)
     
     def _handle_clear_packet(self, packet) -> None:
         """Handle clear packet."""
-        # packet is a tuple: ('clear', id)
+        # packet is a tuple: (PKT_CLEAR, id)
         _, id = packet
         if id == self.instrument_id or id == 255:
-            self.field.reset(0)
+            self.field.reset(_BLOCK_BLACK)
             self.song.clear()
             self.state.song_index = 0
             self.display_manager.show_debug_message("receiving")
-            self.display_manager.hw.display.refresh()
-            self.state.mode = self.modes["clear"]
+            # the whole field was reset, so repaint the full screen
+            self.display_manager.flush(full=True)
+            self.state.mode = MODE_CLEAR
     
     def _handle_event_packet(self, packet) -> None:
         """Handle event packet."""
         if packet is None:
             return
             
-        # packet is a tuple: ('event', ch, tick_start, tick_end, note, intensity)
+        # packet is a tuple: (PKT_EVENT, ch, tick_start, tick_end, note, intensity)
         _, ch, tick_start, tick_end, note, intensity = packet
         
         if ch == self.instrument_id:
+            # also adds the event to pattern_roll
             self.song.add_event(tick_start, tick_end, note, intensity)
-            # add event to pattern_roll
-            pixel_start = int(tick_start / self.song.get_metadata('ticks_per_pixel'))
-            if pixel_start < len(self.song.pattern_roll):
-                self.song.pattern_roll[pixel_start].append(note)
 
 class PatternPlayback:
     """
@@ -373,6 +412,11 @@ class PatternPlayback:
         display_manager: DisplayManager instance
         field: Field instance
         midi: MIDI interface
+        tick_to_time: Cached song metadata (seconds per tick)
+        time_to_tick: Cached song metadata (ticks per second)
+        ticks_per_pixel: Cached song metadata
+        time_to_pixel: Pixels per second (time_to_tick / ticks_per_pixel)
+        pixels_per_tick: 1 / ticks_per_pixel
     """
     
     def __init__(self, song: LocalSong, state: PatternState, 
@@ -383,7 +427,16 @@ class PatternPlayback:
         self.display_manager = display_manager
         self.field = field
         self.midi = midi
-        self.modes = {"paused":0, "playing":1, "reset":2, "clear":3}
+        self.refresh_metadata()
+    
+    def refresh_metadata(self) -> None:
+        """Cache the timing metadata used on every update (call after a header)."""
+        self.tick_to_time = self.song.get_metadata('tick_to_time')
+        self.time_to_tick = self.song.get_metadata('time_to_tick')
+        self.ticks_per_pixel = self.song.get_metadata('ticks_per_pixel')
+        # fold the divide into multipliers for the per-update pixel position
+        self.time_to_pixel = self.time_to_tick / self.ticks_per_pixel
+        self.pixels_per_tick = 1 / self.ticks_per_pixel
     
     def update(self) -> None:
         """
@@ -396,44 +449,53 @@ class PatternPlayback:
             ch = 0
             note = 0
             intensity = 0
+            state = self.state
+            song = self.song
 
-            if self.state.mode == self.modes["playing"] and self.state.song_index < self.song.get_event_count():
+            event_count = song.get_event_count()
+            if state.mode == MODE_PLAYING and state.song_index < event_count:
                 # new event to play?
-                now = time.monotonic()
-                event = self.song.get_event(self.state.song_index)
-                if event and now >= (self.state.playback_start_time + (event[0] - self.state.tick_delta) * self.song.get_metadata('tick_to_time')):
+                now = _monotonic()
+                start_time = state.playback_start_time
+                tick_delta = state.tick_delta
+                event = song.get_event(state.song_index)
+                if event and now >= (start_time + (event[0] - tick_delta) * self.tick_to_time):
                     ch = event[1]
                     note = event[2]
                     intensity = event[3]
-                    self.state.song_index += 1
+                    state.song_index += 1
 
-                    if ch == self.state.instrument_id:
+                    if ch == state.instrument_id:
                         # send USB midi command
-                        i = note % 12
                         if(intensity==0):
                             self.midi.send(NoteOff(note, intensity))
                         else:
-                            if not self.state.is_muted:
+                            if not state.is_muted:
                                 self.midi.send(NoteOn(note, intensity))
                 
-                # update textfields on display
-                self.display_manager.update_channel_info(ch, note, intensity)
+                # update textfields on display (only when they change, so an
+                # idle loop doesn't request a refresh every iteration)
+                channel_info = (ch, note, intensity)
+                if channel_info != state.channel_info:
+                    state.channel_info = channel_info
+                    self.display_manager.update_channel_info(ch, note, intensity)
         
                 # update display
-                self.state.current_pixel = int((self.song.get_metadata('time_to_tick') * (now - self.state.playback_start_time) + self.state.tick_delta) / self.song.get_metadata('ticks_per_pixel')) 
-                if self.state.current_pixel > self.state.previous_pixel:
+                current_pixel = int(self.time_to_pixel * (now - start_time) + tick_delta * self.pixels_per_tick)
+                state.current_pixel = current_pixel
+                if current_pixel > state.previous_pixel:
                     forced_update = False
-                    self.state.previous_pixel = update_roll(
-                        self.state.current_pixel, 
-                        self.state.previous_pixel, 
-                        self.state.selected_channel, 
+                    state.previous_pixel = update_roll(
+                        current_pixel, 
+                        state.previous_pixel, 
+                        state.selected_channel, 
                         forced_update, 
-                        self.song.pattern_roll,
+                        song.pattern_roll,
                         self.field
                     )
-                    self.display_manager.hw.display.refresh()
+                    self.display_manager.refresh()
             
-            if self.state.song_index >= self.song.get_event_count():
+            if state.song_index >= event_count:
                 # end of song (no action since conductor stops and resets song)
                 pass
         except Exception as e:
@@ -465,7 +527,7 @@ class PatternDisplay:
         Args:
             forced_update: Whether to force a full display update
         """
-        self.display_manager.update_mute_leds([False] * 12)
+        self.display_manager.update_mute_leds(_NONE_MUTED)
         self.state.previous_pixel = update_roll(
             self.state.current_pixel, 
             self.state.previous_pixel, 
@@ -475,7 +537,8 @@ class PatternDisplay:
             self.field
         )
         self.display_manager.update_channel_info(0, 0, 0)
-        redraw()
+        self.state.channel_info = (0, 0, 0)
+        self.display_manager.refresh()
     
     def update_channel_info(self, ch: int, note: int, intensity: int) -> None:
         """
@@ -496,7 +559,7 @@ class PatternDisplay:
             message: Debug message to display
         """
         self.display_manager.show_debug_message(message)
-        self.display_manager.hw.display.refresh()
+        self.display_manager.refresh()
     
     def update_mute_leds(self, is_muted: bool) -> None:
         """
@@ -505,7 +568,7 @@ class PatternDisplay:
         Args:
             is_muted: Whether the channel is muted
         """
-        self.display_manager.update_mute_leds([is_muted] * 12)
+        self.display_manager.update_mute_leds(_ALL_MUTED if is_muted else _NONE_MUTED)
 
 def update_roll(pixel_pos, old_pixel_pos, selected_ch, forced_update, pattern_roll, field):
     """
@@ -516,81 +579,104 @@ def update_roll(pixel_pos, old_pixel_pos, selected_ch, forced_update, pattern_ro
         old_pixel_pos: Previous pixel position
         selected_ch: Selected channel
         forced_update: Whether to force a full update
-        pattern_roll: Pattern roll data
+        pattern_roll: Pattern roll data (one row bitmask per pixel)
         field: Field instance for display updates
         
     Returns:
         int: Updated pixel position
     """
-    drum_notes = [36, 38, 42, 57]  # MIDI note numbers for drums
-        
+    pixels = hw.pixels
+    set_block = field.setBlock
+    fx = config.FIELD_X_MAX
+    fy = config.FIELD_Y_MAX
+    roll_len = len(pattern_roll)
+
     if pixel_pos < 0:
         pixel_pos = 0
-    if pixel_pos >= len(pattern_roll):
-        pixel_pos = len(pattern_roll) - 1
+    if pixel_pos >= roll_len:
+        pixel_pos = roll_len - 1
         
     current_column = pixel_pos % 16
     previous_column = old_pixel_pos % 16        
     
+    # field columns lo..hi-1 have roll data, the others are past either end
+    lo = -pixel_pos if pixel_pos < 0 else 0
+    hi = roll_len - pixel_pos
+    if hi > fx:
+        hi = fx
+    if hi < lo:
+        hi = lo
+
     # new page?
     if forced_update:
-        for x, i in enumerate(range(pixel_pos, pixel_pos + config.FIELD_X_MAX)):
-            hw.pixels[x] = (0,0,0)
-            if 0 <= i < len(pattern_roll):
-                for y in range(4):
-                    if not drum_notes[y] in pattern_roll[i]:
-                        field.setBlock(x, y, 0) # black
-                    else:
-                        field.setBlock(x, y, 1) # red
-                        if y == selected_ch:
-                            hw.pixels[x] = (18,70,23)
+        for x in range(lo):
+            pixels[x] = _PX_OFF
+        for x in range(lo, hi):
+            pixels[x] = _PX_OFF
+            mask = pattern_roll[pixel_pos + x]
+            for y in range(4):
+                if not mask & (1 << y):
+                    set_block(x, y, _BLOCK_BLACK)
+                else:
+                    set_block(x, y, _BLOCK_RED)
+                    if y == selected_ch:
+                        pixels[x] = _PX_GREEN
+        for x in range(hi, fx):
+            pixels[x] = _PX_OFF
 
     elif current_column < previous_column:
         column_offset = 16
-        for x, i in enumerate(range(pixel_pos, pixel_pos + config.FIELD_X_MAX)):
-            hw.pixels[x] = (0,0,0)
-            if 0 <= i < len(pattern_roll):
-                for note in pattern_roll[i-column_offset]:
-                    if not note in pattern_roll[i]:
-                        field.setBlock(x, drum_notes.index(note), 0) # black
-                for note in pattern_roll[i]:
-                    if not note in pattern_roll[i-column_offset]:
-                        field.setBlock(x, drum_notes.index(note), 1) # red
-                        if drum_notes.index(note) == selected_ch:
-                            hw.pixels[x] = (18,70,23)
-    
-    for y in range(config.FIELD_Y_MAX):
-        # restore previous column
-        if 0 <= old_pixel_pos < len(pattern_roll) and drum_notes[y] in pattern_roll[old_pixel_pos]:
-            field.setBlock(previous_column, y, 1) # red
-            if y == selected_ch:
-                hw.pixels[previous_column] = (18,70,23)
-        else:
-            field.setBlock(previous_column, y, 0) # black
-            if y == selected_ch:
-                hw.pixels[previous_column] = (0,0,0)
-        # update current column    
-        if 0 <= pixel_pos < len(pattern_roll) and drum_notes[y] in pattern_roll[pixel_pos]:
+        for x in range(lo):
+            pixels[x] = _PX_OFF
+        for x in range(lo, hi):
+            pixels[x] = _PX_OFF
+            i = pixel_pos + x
+            # only redraw rows that differ from the page before
+            mask = pattern_roll[i]
+            changed = mask ^ pattern_roll[i-column_offset]
+            for y in range(4):
+                bit = 1 << y
+                if changed & bit:
+                    if mask & bit:
+                        set_block(x, y, _BLOCK_RED)
+                        if y == selected_ch:
+                            pixels[x] = _PX_GREEN
+                    else:
+                        set_block(x, y, _BLOCK_BLACK)
+        for x in range(hi, fx):
+            pixels[x] = _PX_OFF
+    
+    # restore previous column (from old_pixel_pos, which a forced page repaint
+    # may not have drawn there); on the same column the cursor pass covers it all
+    if previous_column != current_column:
+        old_mask = pattern_roll[old_pixel_pos] if 0 <= old_pixel_pos < roll_len else 0
+        for y in range(fy):
+            if old_mask & (1 << y):
+                set_block(previous_column, y, _BLOCK_RED)
+                if y == selected_ch:
+                    pixels[previous_column] = _PX_GREEN
+            else:
+                set_block(previous_column, y, _BLOCK_BLACK)
+                if y == selected_ch:
+                    pixels[previous_column] = _PX_OFF
+
+    # update current column
+    mask = pattern_roll[pixel_pos] if 0 <= pixel_pos < roll_len else 0
+    for y in range(fy):
+        if mask & (1 << y):
             if y == selected_ch:
-                hw.pixels[current_column] = (200,200,200)
-                field.setBlock(current_column, y, 5) # white
+                pixels[current_column] = _PX_WHITE
+                set_block(current_column, y, _BLOCK_WHITE)
             else:
-                field.setBlock(current_column, y, 3) # light red
+                set_block(current_column, y, _BLOCK_LRED)
         else:
             if y == selected_ch:
-                hw.pixels[current_column] = (14,0,20)
-                field.setBlock(current_column, y, 4) # light blue
+                pixels[current_column] = _PX_PURPLE
+                set_block(current_column, y, _BLOCK_LBLUE)
             else:
-                field.setBlock(current_column, y, 2) # blue
+                set_block(current_column, y, _BLOCK_BLUE)
     return pixel_pos
 
-def redraw():
-    """Create and remove a black sprite to refresh the screen."""
-    black_sprite = displayio.TileGrid(displayio.Bitmap(160, 128, 1), pixel_shader=displayio.Palette(1), x=0, y=0)
-    hw.displayGroup.append(black_sprite)
-    hw.displayGroup.pop()
-    hw.display.refresh()
-
 def show_device_ip():
     """Show the device's IP address."""
     # TODO: Implement IP display
@@ -628,26 +714,6 @@ class PatternPacketError(PatternError):
     """Exception for pattern packet errors."""
     pass
 
-def report_error(display_manager, error_msg, is_fatal=False):
-    """
-    Report an error to the display and console.
-    
-    Args:
-        display_manager: DisplayManager instance
-        error_msg: Error message to display
-        is_fatal: Whether this is a fatal error
-    """
-    # Always print to serial console
-    print(f"{'FATAL ERROR' if is_fatal else 'Error'}: {error_msg}")
-    
-    # Print to display if available
-    if display_manager:
-        try:
-            prefix = "FATAL: " if is_fatal else "Error: "
-            display_manager.show_debug_message(prefix + error_msg[:18])
-        except Exception as e:
-            print(f"Error displaying error message: {e}")
-
 # ------10|-------20|-------30|-------40|-------50|-------60|-------70|-------80|
 
 def main():
@@ -697,7 +763,9 @@ def main():
         
         # init song
         try:
-            song = LocalSong(INSTRUMENT_ID)
+            # one pattern row per drum: song.pattern_roll holds one int per pixel
+            # with bit n set for config.DRUM_NOTES[n] (only defined in pattern mode)
+            song = LocalSong(INSTRUMENT_ID, tuple(config.DRUM_NOTES))
         except Exception as e:
             report_error(display_manager, f"Song init error: {e}", True)
             raise
@@ -717,49 +785,61 @@ def main():
         # Initialize pattern hardware
         pattern_hw = PatternHardware(hw)
         
-        # Initialize pattern display first since it's needed by packet handler
+        # Initialize pattern display and playback first since they're needed by packet handler
         pattern_display = PatternDisplay(display_manager, field, state, song)
+        pattern_playback = PatternPlayback(song, state, display_manager, field, midi)
         
         # Initialize pattern packet handler
-        pattern_packet_handler = PatternPacketHandler(packet_handler, INSTRUMENT_ID, display_manager, field, song, state, pattern_display)
+        pattern_packet_handler = PatternPacketHandler(packet_handler, INSTRUMENT_ID, display_manager, field, song, state, pattern_display, pattern_playback)
         
-        # Initialize pattern playback
-        pattern_playback = PatternPlayback(song, state, display_manager, field, midi)
+        # Bind the per-iteration calls to locals once
+        update_playback = pattern_playback.update
+        read_packet = packet_handler.read_packet
+        handle_packet = pattern_packet_handler.handle_packet
+        max_packets = config.NETWORK_MAX_PACKETS_PER_LOOP
         
         while True:
-            try:
-                pattern_playback.update()
+            # Collect this iteration's display changes into one refresh
+            with display_manager.batched():
+                try:
+                    update_playback()
                 
-                if esp:
-                    try:
-                        packet = packet_handler.read_packet()
-                    except PacketReadError as e:
-                        report_error(display_manager, f"Failed to read packet: {e}")
-                        pattern_display.show_debug_message("packet error")
-                    else:
-                        if packet:
+                    if esp:
+                        # drain queued packets (bounded) so bursts don't lag behind
+                        for _ in range(max_packets):
                             try:
-                                pattern_packet_handler.handle_packet(packet)
+                                packet = read_packet()
+                            except PacketReadError as e:
+                                report_error(display_manager, f"Failed to read packet: {e}")
+                                pattern_display.show_debug_message("packet error")
+                                break
+                            if not packet:
+                                break
+                            try:
+                                handle_packet(packet)
                             except PatternPacketError as e:
                                 report_error(display_manager, f"Failed to handle packet: {e}")
                                 pattern_display.show_debug_message("packet error")
                 
                 
                 
-                # check key input
-                pattern_hw.handle_key_input(state.current_pixel, state.selected_channel, song, state, field, display_manager)
+                    # Read all keys once; each bit is a key pressed since the last scan
+                    pressed = hw.scan_keys()
+
+                    # check key input
+                    pattern_hw.handle_key_input(pressed, state.current_pixel, state.selected_channel, song, state, field, display_manager)
                 
-                # Handle menu navigation
-                pattern_hw.handle_menu_navigation(menu_manager)
+                    # Handle menu navigation
+                    pattern_hw.handle_menu_navigation(menu_manager, pressed)
                 
-                # Handle drum selection
-                pattern_hw.handle_drum_selection(state, song, field, display_manager)
-            except PatternError as e:
-                report_error(display_manager, str(e))
-                pattern_display.show_debug_message("error")
-            except Exception as e:
-                report_error(display_manager, f"Unexpected error: {e}")
-                pattern_display.show_debug_message("error")
+                    # Handle drum selection
+                    pattern_hw.handle_drum_selection(state, song, field, display_manager)
+                except PatternError as e:
+                    report_error(display_manager, str(e))
+                    pattern_display.show_debug_message("error")
+                except Exception as e:
+                    report_error(display_manager, f"Unexpected error: {e}")
+                    pattern_display.show_debug_message("error")
     except Exception as e:
         report_error(display_manager, f"Fatal error: {e}", True)
         raise
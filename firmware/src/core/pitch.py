@@ -35,6 +35,7 @@
 # ******************************************************************************
 import config.config as config
 import espnow
+import wifi
 import time
 import displayio
 import adafruit_imageload
@@ -49,6 +50,21 @@ from src.common.network import PacketHandler, PacketReadError
 from src.common.menu import MenuManager
 from src.common.song import LocalSong
 
+_monotonic_ns = time.monotonic_ns   # bound once for the playback hot path
+
+_sprite_sheet = None   # (bitmap, palette) of the roll sprites, decoded once
+
+def _load_sprite_sheet():
+    """Load the 4x4 roll sprite sheet, later calls reuse the decoded bitmap"""
+    global _sprite_sheet
+    if _sprite_sheet is None:
+        _sprite_sheet = adafruit_imageload.load(
+            "assets/images/4x4.bmp",
+            bitmap=displayio.Bitmap,
+            palette=displayio.Palette
+        )
+    return _sprite_sheet
+
 #------10|-------20|-------30|-------40|-------50|-------60|-------70|-------80|
 class MIDIController:
     """Handles MIDI input/output operations"""
@@ -62,11 +78,19 @@ class MIDIController:
     def send_note_off(self, note):
         """Send a MIDI note off message"""
         self.midi.send(NoteOff(note, 0))
+    
+    def send_events(self, events):
+        """Send (note, intensity) pairs in one USB write, intensity 0 is note off"""
+        self.midi.send([NoteOn(note, intensity) if intensity else NoteOff(note, 0)
+                        for note, intensity in events])
 
 class NetworkManager:
     """Handles network communication"""
     def __init__(self, instrument_id, mac_broadcast):
         self.esp = espnow.ESPNow()
+        # keep the radio listening between beacons, power save delays ESP-NOW frames
+        if hasattr(wifi.radio, "power_management"):  # CircuitPython 9.1+
+            wifi.radio.power_management = wifi.PowerManagement.NONE
         self.peer_broadcast = espnow.Peer(mac=mac_broadcast)
         self.esp.peers.append(self.peer_broadcast)
         self.network = PacketHandler(self.esp, instrument_id, self.peer_broadcast)
@@ -75,6 +99,12 @@ class NetworkManager:
         """Send a network packet"""
         self.network.send_packet(packet_type, data, self.peer_broadcast)
     
+    def send_frames(self, packet):
+        """Send a prebuilt packet, type byte included, without copying it"""
+        # esp.send() returns once the frame is queued in the radio driver, it does
+        # not wait for the broadcast to go out, so the key scan is never held up
+        self.esp.send(packet, self.peer_broadcast)
+    
     def read_packet(self):
         """Read an incoming network packet"""
         return self.network.read_packet()
@@ -91,16 +121,18 @@ class DisplayController:
     """Manages display and visualization"""
     def __init__(self, display, hw):
         self.display_manager = DisplayManager(display, hw)
+        # piano roll bitmap: one row per pixel, one bit per field column
+        self.roll_stride = (config.FIELD_X_MAX + 7) // 8  # bytes per row
+        # field column for each MIDI note, notes outside the view stick to the edges
+        offset = (config.MEDIAN_OCTAVE - 2) * 12  # left edge of visible pianoroll
+        x_max = config.FIELD_X_MAX - 1
+        self.note_x = bytearray(min(max(n - offset, 0), x_max) for n in range(128))
         self._initialize_display()
     
     def _initialize_display(self):
         """Initialize the display with sprite sheet and text fields"""
         try:
-            sprite_sheet, palette = adafruit_imageload.load(
-                "assets/images/4x4.bmp",
-                bitmap=displayio.Bitmap,
-                palette=displayio.Palette
-            )
+            sprite_sheet, palette = _load_sprite_sheet()
             self.display_manager.x_max = config.FIELD_X_MAX
             self.display_manager.y_max = config.FIELD_Y_MAX
             self.display_manager.initialize_pattern_field(sprite_sheet, palette, 0, 0)
@@ -123,34 +155,43 @@ class DisplayController:
         """Update the mute LED states"""
         self.display_manager.update_mute_leds(states)
     
-    def update_roll(self, pixel_pos, old_pixel_pos, piano_roll):
-        """Update the piano roll display"""
+    def fill_mute_leds(self, is_muted):
+        """Set every LED to the mute (or off) color in one fill"""
+        colors = self.display_manager.colors
+        self.display_manager.hw.pixels.fill(colors['mute'] if is_muted else colors['off'])
+    
+    def update_roll(self, pixel_pos, old_pixel_pos, roll_bmp):
+        """Update the piano roll display, only touching cells that differ from the old position"""
+        stride = self.roll_stride
+        rows = len(roll_bmp) // stride
         pixel_pos = max(0, pixel_pos)
-        pixel_pos = min(pixel_pos, len(piano_roll))
-            
-        offset = (config.MEDIAN_OCTAVE - 2) * 12  # left edge of visible pianoroll
-        delta = pixel_pos - old_pixel_pos
+        pixel_pos = min(pixel_pos, rows)
+        set_block = self.display_manager.field.setBlock
+        dirty = False
         
         for y in range(config.FIELD_Y_MAX):
             i = pixel_pos + y
-            if i < len(piano_roll):
-                # Clear old notes
-                for p in piano_roll[i - delta]:
-                    if p not in piano_roll[i]:
-                        x = self._clamp(p - offset, 0, config.FIELD_X_MAX - 1)
-                        if 0 <= x < config.FIELD_X_MAX and 0 <= y < config.FIELD_Y_MAX:
-                            self.display_manager.field.setBlock(x, y, 0)
-                # Draw new notes
-                for p in piano_roll[i]:
-                    if p not in piano_roll[i - delta]:
-                        x = self._clamp(p - offset, 0, config.FIELD_X_MAX - 1)
-                        if 0 <= x < config.FIELD_X_MAX and 0 <= y < config.FIELD_Y_MAX:
-                            self.display_manager.field.setBlock(x, y, 1)
-        hw.display.refresh()
-    
-    def _clamp(self, val, min_val, max_val):
-        """Clamp a value between min and max"""
-        return max(min_val, min(val, max_val))
+            if i < rows:
+                new = i * stride
+                old = (old_pixel_pos + y) * stride
+                has_old = 0 <= old_pixel_pos + y < rows
+                for b in range(stride):
+                    new_bits = roll_bmp[new + b]
+                    changed = new_bits ^ roll_bmp[old + b] if has_old else new_bits
+                    # clear old notes (0) and draw new notes (1)
+                    if not changed:
+                        continue
+                    dirty = True
+                    x = b << 3
+                    while changed:
+                        if changed & 1:
+                            set_block(x, y, new_bits & 1)
+                        changed >>= 1
+                        new_bits >>= 1
+                        x += 1
+        # displayio only sends the areas that changed; skip the refresh if none did
+        if dirty:
+            self.display_manager.refresh()
 
 class InputHandler:
     """Handles user input and key presses"""
@@ -158,39 +199,52 @@ class InputHandler:
         self.hw = hw
         self.midi = midi_controller
         self.network = network_manager
+        self.key_on_color = colorwheel(config.MEDIAN_OCTAVE * 20 & 255)
+        # live packet buffer, one 'l' frame (tag, channel, note, intensity) per key
+        self.live_buf = bytearray(bytes((ord('l'), config.INSTRUMENT_ID, 0, 0)) * 16)
+        self.live_view = memoryview(self.live_buf)
     
     def process_input(self):
         """Process all user input"""
         try:
-            for i in range(16):
-                key = self.hw.key_change(i)
-                if key[1]:
-                    self._handle_key_press(i, key)
+            changes = []
+            # one matrix read, menu keys 18/19 are left to key_new()
+            changed, state = self.hw.scan_key_changes(16)
+            i = 0
+            while changed:
+                if changed & 1:
+                    self._handle_key_press(i, state & 1, changes)
+                changed >>= 1
+                state >>= 1
+                i += 1
+            # keys changed in the same scan go out as one MIDI write and one packet
+            if changes:
+                self.midi.send_events(changes)
+                self._send_live(changes)
+                self.hw.pixels.show()
         except Exception as e:
             print(f"Input processing error: {e}")
     
-    def _handle_key_press(self, i, key):
-        """Handle a single key press event"""
-        try:
-            if config.KEY_PCB_TO_NOTE[i] != -1:
-                note = config.MEDIAN_OCTAVE * 16 + config.KEY_PCB_TO_NOTE[i]
-                packet = bytearray()
-                packet.append(ord('l'))
-                packet.append(config.INSTRUMENT_ID)
-                packet.append(note)
-                
-                if key[0]:
-                    self.hw.pixels[i] = colorwheel(config.MEDIAN_OCTAVE * 20 & 255)
-                    self.midi.send_note_on(note, config.DEFAULT_INTENSITY)
-                    packet.append(config.DEFAULT_INTENSITY)
-                else:
-                    self.hw.pixels[i] = config.UI_COLORS['key_off']
-                    self.midi.send_note_off(note)
-                    packet.append(0)
-                    
-                self.network.send_packet('l', packet[1:])
-        except Exception as e:
-            print(f"Key press error: {e}")
+    def _handle_key_press(self, i, down, changes):
+        """Handle a single key press/release (queues (note, intensity) on changes)"""
+        if config.KEY_PCB_TO_NOTE[i] != -1:
+            note = config.MEDIAN_OCTAVE * 16 + config.KEY_PCB_TO_NOTE[i]
+            if down:
+                self.hw.pixels[i] = self.key_on_color
+                changes.append((note, config.DEFAULT_INTENSITY))
+            else:
+                self.hw.pixels[i] = config.UI_COLORS['key_off']
+                changes.append((note, 0))
+    
+    def _send_live(self, changes):
+        """Send all key changes in one packet of back-to-back 'l' frames"""
+        buf = self.live_buf
+        n = 0
+        for note, intensity in changes:
+            buf[n + 2] = note
+            buf[n + 3] = intensity
+            n += 4
+        self.network.send_frames(self.live_view[:n])
 
 class PitchSynth:
     """Main instrument class that coordinates all components"""
@@ -204,14 +258,31 @@ class PitchSynth:
             self.input = InputHandler(hw, self.midi, self.network)
             
             self.song = LocalSong(config.INSTRUMENT_ID)
+            # key color per MIDI note, one shared tuple per octave
+            octave_colors = [colorwheel(octave * 20 & 255) for octave in range(11)]
+            self._note_color = tuple(octave_colors[n // 12] for n in range(128))
             self.song_index = 0
             self.mute = 0
             self.pixel_pos = 0
             self.old_pixel_pos = 0
             self.tick_delta = 0
-            self.start_time = time.monotonic()
-            self.piano_roll = [[] for _ in range(1000)]
+            self.start_ns = time.monotonic_ns()
+            self._refresh_metadata()
+            self.roll_len = 1000  # rows in roll_bmp, resized by the song header
+            self.roll_bmp = bytearray(self.roll_len * self.display.roll_stride)
             self.mode = config.PLAYBACK_STATES["clear"]
+            # built once, handle_packet only looks the type up
+            self.packet_handlers = {
+                config.PKT_TICK: self._handle_tick_packet,
+                config.PKT_BEGIN: self._handle_begin_packet,
+                config.PKT_STOP: self._handle_stop_packet,
+                config.PKT_EVENT: self._handle_event_packet,
+                config.PKT_HEADER: self._handle_header_packet,
+                config.PKT_MUTE: self._handle_mute_packet,
+                config.PKT_UPDATE: self._handle_update_packet,
+                config.PKT_RESET: self._handle_reset_packet,
+                config.PKT_CLEAR: self._handle_clear_packet
+            }
             
             self._initialize_menu()
             self._initialize_network()
@@ -239,75 +310,57 @@ class PitchSynth:
             except Exception as display_error:
                 print(f"Failed to display error: {display_error}")
         if fatal:
-            raise  # Re-raise the original exception
+            raise error
         
     def _initialize_menu(self) -> None:
         """Initialize the menu system with dispatch table."""
-        try:
-            menu_dispatch = {
-                'send_song': lambda: self.network.send_packet('s', bytearray(), self.network.peer_broadcast),
-                'set_channel': lambda: self.network.send_packet('c', bytearray([config.INSTRUMENT_ID]), self.network.peer_broadcast),
-                'show_my_ip': lambda: self.display.show_debug_message(f"IP: {hw.ip}"),
-                'send_pair': lambda: self.network.send_pair(),
-                'show_paired_devices': lambda: self.display.show_debug_message(f"Paired: {len(self.network.esp.peers)}"),
-                'set_mode': lambda mode: setattr(config, 'MODE', ['conductor', 'melodic', 'chord', 'arpeggio', 'drum'][mode])
-            }
-            self.menu_manager = MenuManager(config.MENU_FILE, self.display.display_manager, menu_dispatch)
-        except Exception as e:
-            self._handle_error("menu initialization", e, fatal=True)
+        menu_dispatch = {
+            'send_song': lambda: self.network.send_packet('s', bytearray(), self.network.peer_broadcast),
+            'set_channel': lambda: self.network.send_packet('c', bytearray([config.INSTRUMENT_ID]), self.network.peer_broadcast),
+            'show_my_ip': lambda: self.display.show_debug_message(f"IP: {hw.ip}"),
+            'send_pair': lambda: self.network.send_pair(),
+            'show_paired_devices': lambda: self.display.show_debug_message(f"Paired: {len(self.network.esp.peers)}"),
+            'set_mode': lambda mode: setattr(config, 'MODE', ['conductor', 'melodic', 'chord', 'arpeggio', 'drum'][mode])
+        }
+        self.menu_manager = MenuManager(config.MENU_FILE, self.display.display_manager, menu_dispatch)
         
     def _initialize_network(self) -> None:
         """Initialize network connection if in pitch mode."""
-        try:
-            if config.MODE in ("pitch", "pitch2"):
-                self.network.send_pair()
-        except Exception as e:
-            self._handle_error("network initialization", e, fatal=True)
+        if config.MODE in ("pitch", "pitch2"):
+            self.network.send_pair()
         
     def _initialize_keys(self) -> None:
         """Initialize the key states and LED colors."""
-        try:
-            for i in range(16):
-                if i < 12:
-                    hw.pixels[config.KEY_NOTE_TO_PCB[i]] = config.UI_COLORS['key_off']
-                else:
-                    hw.pixels[config.KEY_NOTE_TO_PCB[i]] = (0, 0, 0)
-        except Exception as e:
-            self._handle_error("key initialization", e, fatal=True)
+        # LEDs are written as whole frames, show() after each batch of changes
+        hw.pixels.auto_write = False
+        for i in range(16):
+            if i < 12:
+                hw.pixels[config.KEY_NOTE_TO_PCB[i]] = config.UI_COLORS['key_off']
+            else:
+                hw.pixels[config.KEY_NOTE_TO_PCB[i]] = (0, 0, 0)
+        hw.pixels.show()
 
     def handle_packet(self, packet_type, *args):
         """Handle incoming network packets based on their type."""
         try:
-            packet_handlers = {
-                'tick': self._handle_tick_packet,
-                'begin': self._handle_begin_packet,
-                'stop': self._handle_stop_packet,
-                'event': self._handle_event_packet,
-                'header': self._handle_header_packet,
-                'mute': self._handle_mute_packet,
-                'update': self._handle_update_packet,
-                'reset': self._handle_reset_packet,
-                'clear': self._handle_clear_packet
-            }
-            
-            handler = packet_handlers.get(packet_type)
+            handler = self.packet_handlers.get(packet_type)
             if handler:
                 handler(*args)
             else:
                 print(f"Unknown packet type: {packet_type}")
         except Exception as e:
-            self._handle_error(f"packet {packet_type}", e)
+            self._handle_error(f"packet {chr(packet_type)}", e)
 
     def run(self) -> None:
         """Main execution loop."""
-        try:
-            while True:
+        while True:
+            try:
                 self._process_playback()
                 self._process_network()
                 self._process_input()
                 self._process_menu()
-        except Exception as e:
-            self._handle_error("main loop", e)
+            except Exception as e:
+                self._handle_error("main loop", e)
 
     def _process_playback(self) -> None:
         """Process song playback if in playing state."""
@@ -318,48 +371,52 @@ class PitchSynth:
             self._handle_error("playback", e)
             self.mode = config.PLAYBACK_STATES["paused"]
 
+    def _refresh_metadata(self) -> None:
+        """Cache the timing metadata used on every played event (call after a header)."""
+        self.ticks_per_beat = self.song.get_metadata('ticks_per_beat')
+        # Exact integer conversion: tick = elapsed_ns * tick_num // tick_den
+        self.tick_num = (self.song.get_metadata('tempo') * self.ticks_per_beat *
+                         self.song.get_metadata('denominator'))
+        self.tick_den = 60 * 4 * 1000000000
+
     def _handle_playback(self) -> None:
         """Handle the playback of a single event."""
-        try:
-            now = time.monotonic()
-            event = self.song.get_event(self.song_index)
-            if now >= (self.start_time + (event[0] - self.tick_delta) * self.song.get_metadata('tick_to_time')):
-                self._play_event(event)
-                self.song_index += 1
+        now_tick = (_monotonic_ns() - self.start_ns) * self.tick_num // self.tick_den + self.tick_delta
+        event = self.song.get_event(self.song_index)
+        if now_tick >= event[0]:
+            self._play_event(event)
+            hw.pixels.show()
+            self.song_index += 1
                 
-                # Update display
-                self.pixel_pos = int((self.song.get_metadata('time_to_tick') * (now - self.start_time) + self.tick_delta) / 
-                                   (self.song.get_metadata('ticks_per_beat') / config.PIXELS_PER_BEAT))
-                if self.pixel_pos > self.old_pixel_pos:
-                    self.display.update_roll(self.pixel_pos, self.old_pixel_pos, self.piano_roll)
-                    self.old_pixel_pos = self.pixel_pos
-        except Exception as e:
-            self._handle_error("playback handling", e)
-            self.mode = config.PLAYBACK_STATES["paused"]
+            # Update display
+            self.pixel_pos = now_tick * config.PIXELS_PER_BEAT // self.ticks_per_beat
+            if self.pixel_pos > self.old_pixel_pos:
+                self.display.update_roll(self.pixel_pos, self.old_pixel_pos, self.roll_bmp)
+                self.old_pixel_pos = self.pixel_pos
 
     def _play_event(self, event):
         """Play a single MIDI event."""
-        try:
-            ch, note, intensity = event[1], event[2], event[3]
-            if ch == config.INSTRUMENT_ID:
-                i = note % 12
-                if intensity == 0:
-                    self.midi.send_note_off(note)
-                    if not self.mute:
-                        hw.pixels[config.KEY_NOTE_TO_PCB[i]] = config.UI_COLORS['key_off']
-                else:
-                    if not self.mute:
-                        self.midi.send_note_on(note, intensity)
-                        hw.pixels[config.KEY_NOTE_TO_PCB[i]] = colorwheel(int(note / 12) * 20 & 255)
-        except Exception as e:
-            self._handle_error("event playback", e)
+        ch, note, intensity = event[1], event[2], event[3]
+        if ch == config.INSTRUMENT_ID:
+            i = note % 12
+            if intensity == 0:
+                self.midi.send_note_off(note)
+                if not self.mute:
+                    hw.pixels[config.KEY_NOTE_TO_PCB[i]] = config.UI_COLORS['key_off']
+            else:
+                if not self.mute:
+                    self.midi.send_note_on(note, intensity)
+                    hw.pixels[config.KEY_NOTE_TO_PCB[i]] = self._note_color[note]
 
     def _process_network(self) -> None:
         """Process incoming network packets."""
         if config.MODE in ("pitch", "pitch2"):
             try:
-                packet = self.network.read_packet()
-                if packet:
+                # drain queued packets (bounded) so bursts don't wait a frame each
+                for _ in range(config.NETWORK_MAX_PACKETS_PER_LOOP):
+                    packet = self.network.read_packet()
+                    if not packet:
+                        break
                     result = self.network.handle_packet(packet)
                     if result:
                         self.handle_packet(*result)
@@ -375,10 +432,8 @@ class PitchSynth:
     def _process_menu(self) -> None:
         """Process menu navigation and selection."""
         try:
-            rotation = self._get_rotation()
-            if rotation == 1:
-                self.menu_manager.handle_rotation(rotation)
-            elif rotation == -1:
+            rotation = hw.menu_rotation()
+            if rotation:
                 self.menu_manager.handle_rotation(rotation)
                 
             if hw.key_new(19):
@@ -388,139 +443,106 @@ class PitchSynth:
         except Exception as e:
             self._handle_error("menu processing", e)
 
-    def _get_rotation(self):
-        """Get the current rotation value from the hardware."""
-        try:
-            if config.HW_VERSION == 1.1:
-                return hw.check_rotation(0, 512)
-            elif config.HW_VERSION == 1.0:
-                if hw.check_analog_rotation(config.ROTATION_CW):
-                    return 1
-                if hw.check_analog_rotation(config.ROTATION_CCW):
-                    return -1
-            return 0
-        except Exception as e:
-            self._handle_error("rotation", e)
-            return 0
-
     def _handle_tick_packet(self, tick):
         """Handle tick packet for synchronization."""
-        try:
-            now_tick = int(self.song.get_metadata('time_to_tick') * (time.monotonic() - self.start_time))
-            self.tick_delta = tick - now_tick
-        except Exception as e:
-            self._handle_error("tick packet", e)
+        now_tick = (_monotonic_ns() - self.start_ns) * self.tick_num // self.tick_den
+        self.tick_delta = tick - now_tick
 
     def _handle_begin_packet(self):
         """Handle begin packet to start playback."""
-        try:
-            if self.song.get_event_count() > 0:
-                self.start_time = time.monotonic() - self.song.get_event(self.song_index)[0] * self.song.get_metadata('tick_to_time')
-                self.mode = config.PLAYBACK_STATES["playing"]
-                self.display.show_debug_message("playing")
-                self.display.set_pause_led(False)
-        except Exception as e:
-            self._handle_error("begin packet", e)
+        if self.song.get_event_count() > 0:
+            self.start_ns = _monotonic_ns() - self.song.get_event(self.song_index)[0] * self.tick_den // self.tick_num
+            self.mode = config.PLAYBACK_STATES["playing"]
+            self.display.show_debug_message("playing")
+            self.display.set_pause_led(False)
+            hw.pixels.show()
 
     def _handle_stop_packet(self):
         """Handle stop packet to pause playback."""
-        try:
-            self.mode = config.PLAYBACK_STATES["paused"]
-            self.display.show_debug_message("paused")
-            self.display.set_pause_led(True)
-        except Exception as e:
-            self._handle_error("stop packet", e)
+        self.mode = config.PLAYBACK_STATES["paused"]
+        self.display.show_debug_message("paused")
+        self.display.set_pause_led(True)
+        hw.pixels.show()
 
     def _handle_event_packet(self, ch, tick_start, tick_end, note, intensity):
         """Handle event packet containing note information."""
-        try:
-            if ch == config.INSTRUMENT_ID:
-                self.song.add_event(tick_start, tick_end, note, intensity)
-                pixel_start = int(tick_start / (self.song.get_metadata('ticks_per_beat') / config.PIXELS_PER_BEAT))
-                self.piano_roll[pixel_start].append(note)
-        except Exception as e:
-            self._handle_error("event packet", e)
+        if ch == config.INSTRUMENT_ID:
+            self.song.add_event(tick_start, tick_end, note, intensity)
+            pixel_start = tick_start * config.PIXELS_PER_BEAT // self.ticks_per_beat
+            if pixel_start >= self.roll_len:
+                return
+            x = self.display.note_x[note]
+            self.roll_bmp[pixel_start * self.display.roll_stride + (x >> 3)] |= 1 << (x & 7)
 
     def _handle_header_packet(self, ticks_per_beat, max_ticks, tempo, numerator, denominator, nr_instruments):
         """Handle header packet containing song metadata."""
-        try:
-            self.song.update_header(ticks_per_beat, max_ticks, tempo, numerator, denominator, nr_instruments)
-            if not self.piano_roll:
-                max_pixels = int(max_ticks / (ticks_per_beat / config.PIXELS_PER_BEAT))
-                self.piano_roll = [[] * max_pixels for _ in range(max_pixels)]
-            self.mode = config.PLAYBACK_STATES["paused"]
-        except Exception as e:
-            self._handle_error("header packet", e)
+        self.song.update_header(ticks_per_beat, max_ticks, tempo, numerator, denominator, nr_instruments)
+        self._refresh_metadata()
+        # headers go to every instrument, keep the roll unless the song length changed
+        max_pixels = max_ticks * config.PIXELS_PER_BEAT // ticks_per_beat
+        if max_pixels != self.roll_len:
+            self.roll_len = max_pixels
+            self.roll_bmp = bytearray(max_pixels * self.display.roll_stride)
+        self.mode = config.PLAYBACK_STATES["paused"]
 
     def _handle_mute_packet(self, ch, intensity):
         """Handle mute packet to control audio output."""
-        try:
-            if ch == config.INSTRUMENT_ID:
-                self.mute = intensity
-                if self.mute:
-                    self.display.update_mute_leds([True] * 16)
-                    self.display.show_debug_message("muted")
-                else:
-                    self.display.update_mute_leds([False] * 16)
-                    self.display.show_debug_message(" ")
-                hw.display.refresh()
-        except Exception as e:
-            self._handle_error("mute packet", e)
+        if ch == config.INSTRUMENT_ID:
+            self.mute = intensity
+            # show_debug_message already refreshes the display
+            if self.mute:
+                self.display.fill_mute_leds(True)
+                self.display.show_debug_message("muted")
+            else:
+                self.display.fill_mute_leds(False)
+                self.display.show_debug_message(" ")
+            hw.pixels.show()
 
     def _handle_update_packet(self):
         """Handle update packet to refresh display."""
-        try:
-            self.display.show_debug_message("update")
-            self.display.update_roll(self.pixel_pos, self.old_pixel_pos, self.piano_roll)
-        except Exception as e:
-            self._handle_error("update packet", e)
+        self.display.show_debug_message("update")
+        self.display.update_roll(self.pixel_pos, self.old_pixel_pos, self.roll_bmp)
 
     def _handle_reset_packet(self):
         """Handle reset packet to restart playback."""
-        try:
-            self._clear_roll(self.old_pixel_pos, self.piano_roll)
-            self.song_index = 0
-            if self.song.get_event_count() > 0:
-                self.start_time = time.monotonic() - self.song.get_event(self.song_index)[0] * self.song.get_metadata('tick_to_time')
-            self.pixel_pos = 1
-            self.old_pixel_pos = 0
-            self.display.show_debug_message("reset")
-            self.display.update_roll(self.pixel_pos, self.old_pixel_pos, self.piano_roll)
-            self.old_pixel_pos = self.pixel_pos
-        except Exception as e:
-            self._handle_error("reset packet", e)
+        self._clear_roll(self.old_pixel_pos, self.roll_bmp)
+        self.song_index = 0
+        if self.song.get_event_count() > 0:
+            self.start_ns = _monotonic_ns() - self.song.get_event(self.song_index)[0] * self.tick_den // self.tick_num
+        self.pixel_pos = 1
+        self.old_pixel_pos = 0
+        self.display.show_debug_message("reset")
+        self.display.update_roll(self.pixel_pos, self.old_pixel_pos, self.roll_bmp)
+        self.old_pixel_pos = self.pixel_pos
 
     def _handle_clear_packet(self, ch):
         """Handle clear packet to reset the song."""
-        try:
-            if ch == config.INSTRUMENT_ID or ch == 255:
-                self._clear_roll(self.old_pixel_pos, self.piano_roll)
-                self.song.clear()
-                self.song_index = 0
-                self.piano_roll = []
-                self.display.show_debug_message("receiving")
-                hw.display.refresh()
-                self.mode = config.PLAYBACK_STATES["clear"]
-        except Exception as e:
-            self._handle_error("clear packet", e)
+        if ch == config.INSTRUMENT_ID or ch == 255:
+            self._clear_roll(self.old_pixel_pos, self.roll_bmp)
+            self.song.clear()
+            self.song_index = 0
+            self.roll_len = 0
+            self.roll_bmp = bytearray()
+            self.display.show_debug_message("receiving")
+            hw.display.refresh()
+            self.mode = config.PLAYBACK_STATES["clear"]
 
-    def _clear_roll(self, pixel_pos, piano_roll):
+    def _clear_roll(self, pixel_pos, roll_bmp):
         """Clear the piano roll display at the given position."""
-        try:
-            offset = (config.MEDIAN_OCTAVE - 2) * 12  # left edge of visible pianoroll
-            for y in range(config.FIELD_Y_MAX):
-                i = pixel_pos + y
-                if i < len(piano_roll):
-                    for p in piano_roll[i]:
-                        x = self._clamp(p - offset, 0, config.FIELD_X_MAX - 1)
-                        if 0 <= x < config.FIELD_X_MAX and 0 <= y < config.FIELD_Y_MAX:
-                            self.display.display_manager.field.setBlock(x, y, 0)
-        except Exception as e:
-            self._handle_error("clear roll", e)
-
-    def _clamp(self, val, min_val, max_val):
-        """Clamp a value between min and max."""
-        return max(min_val, min(val, max_val))
+        stride = self.display.roll_stride
+        rows = len(roll_bmp) // stride
+        set_block = self.display.display_manager.field.setBlock
+        for y in range(config.FIELD_Y_MAX):
+            i = pixel_pos + y
+            if 0 <= i < rows:
+                for b in range(stride):
+                    bits = roll_bmp[i * stride + b]
+                    x = b << 3
+                    while bits:
+                        if bits & 1:
+                            set_block(x, y, 0)
+                        bits >>= 1
+                        x += 1
 
 #------10|-------20|-------30|-------40|-------50|-------60|-------70|-------80|
 